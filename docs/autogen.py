@@ -2,9 +2,6 @@
 '''
 General documentation architecture:
 '''
-from __future__ import print_function
-from __future__ import unicode_literals
-
 import re
 import inspect
 import os
@@ -59,13 +56,18 @@ PAGES = [
             device.USBDevice.open,
             device.USBDevice.data_start,
             device.USBDevice.data_stop,
+            device.USBDevice.start_prefetch,
             device.USBDevice.close,
             device.USBDevice.shutdown,
             device.USBDevice.obtain_device_info,
             device.USBDevice.send_default_config,
             device.USBDevice.set_data_exchange_blocking,
+            device.USBDevice.set_usb_buffer_number,
+            device.USBDevice.set_usb_buffer_size,
             device.USBDevice.set_config,
+            device.USBDevice.set_config_batch,
             device.USBDevice.get_config,
+            device.USBDevice.get_config_batch,
             device.USBDevice.get_event,
             device.USBDevice.get_packet_container,
             device.USBDevice.get_packet_header,
@@ -87,16 +89,20 @@ PAGES = [
             device.SerialDevice.open,
             device.SerialDevice.data_start,
             device.SerialDevice.data_stop,
+            device.SerialDevice.start_prefetch,
             device.SerialDevice.close,
             device.SerialDevice.shutdown,
             device.SerialDevice.send_default_config,
             device.SerialDevice.set_data_exchange_blocking,
             device.SerialDevice.set_config,
+            device.SerialDevice.set_config_batch,
             device.SerialDevice.get_config,
+            device.SerialDevice.get_config_batch,
             device.SerialDevice.get_event,
             device.SerialDevice.get_packet_container,
             device.SerialDevice.get_packet_header,
             device.SerialDevice.get_polarity_event,
+            device.SerialDevice.get_special_event,
         ],
     },
     {
@@ -171,11 +177,13 @@ PAGES = [
         'methods': [
             dynapse.DYNAPSE.obtain_device_info,
             dynapse.DYNAPSE.open,
+            dynapse.DYNAPSE.invalidate_config_cache,
             dynapse.DYNAPSE.set_bias_from_json,
             dynapse.DYNAPSE.clear_sram,
             dynapse.DYNAPSE.setup_sram,
             dynapse.DYNAPSE.set_chip_bias,
             dynapse.DYNAPSE.set_bias,
+            dynapse.DYNAPSE.wait_stable,
             dynapse.DYNAPSE.set_fpga_bias,
             dynapse.DYNAPSE.set_activity_bias,
             dynapse.DYNAPSE.get_cf_bias,
@@ -183,10 +191,15 @@ PAGES = [
             dynapse.DYNAPSE.save_fpga_bias_to_json,
             dynapse.DYNAPSE.start_data_stream,
             dynapse.DYNAPSE.core_xy_to_neuron_id,
+            dynapse.DYNAPSE.core_xy_to_neuron_id_bulk,
             dynapse.DYNAPSE.core_id_to_neuron_id,
+            dynapse.DYNAPSE.core_id_to_neuron_id_bulk,
             dynapse.DYNAPSE.write_poisson_spikerate,
+            dynapse.DYNAPSE.write_poisson_spikerate_batch,
             dynapse.DYNAPSE.write_sram_N,
+            dynapse.DYNAPSE.write_sram_N_batch,
             dynapse.DYNAPSE.write_cam,
+            dynapse.DYNAPSE.write_cam_batch,
             dynapse.DYNAPSE.get_event,
         ],
     },
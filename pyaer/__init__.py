@@ -3,9 +3,6 @@
 Author: Yuhuang Hu
 Email : duguyue100@gmail.com
 """
-from __future__ import absolute_import
-from __future__ import print_function
-
 import os
 
 from pyaer import log
@@ -1214,7 +1214,11 @@ class DAVIS(USBDevice):
         return utils.write_json(file_path, bias_obj)
 
     def start_data_stream(
-        self, send_default_config=True, max_packet_size=None, max_packet_interval=None
+        self,
+        send_default_config=True,
+        max_packet_size=None,
+        max_packet_interval=None,
+        prefetch=None,
     ):
         """Start streaming data.
 
@@ -1234,6 +1238,11 @@ class DAVIS(USBDevice):
                 The value is in microseconds, and is checked across all
                 types of events contained in the EventPacketContainer.<br/>
                 The default is `None` (use default setting: 10ms)
+            prefetch: `bool`<br/>
+                fetch packet containers in a background thread,
+                see `start_prefetch`. If None, prefetch as the last
+                data stream did, so that restarts keep the setting.<br/>
+                `default is None`
         """
         if send_default_config is True:
             self.send_default_config()
@@ -1245,6 +1254,7 @@ class DAVIS(USBDevice):
 
         self.data_start()
         self.set_data_exchange_blocking()
+        self._restore_prefetch(prefetch)
 
     def get_polarity_event(self, packet_header, noise_filter=False, color_filter=False):
         """Get a packet of polarity event.
@@ -1380,6 +1390,10 @@ class DAVIS(USBDevice):
             frames = []
             frames_ts = []
             imu_events = None
+            # collect the packets and stack them once
+            pol_packets = []
+            special_packets = []
+            imu_packets = []
             for packet_id in range(packet_number):
                 packet_header, packet_type = self.get_packet_header(
                     packet_container, packet_id
@@ -1389,11 +1403,7 @@ class DAVIS(USBDevice):
                         events, num_events = self.get_polarity_event(
                             packet_header, self.filter_noise, self.filter_color
                         )
-                        pol_events = (
-                            np.hstack((pol_events, events))
-                            if pol_events is not None
-                            else events
-                        )
+                        pol_packets.append(events)
                     elif mode == "events_hist":
                         hist, num_events = self.get_polarity_hist(
                             packet_header, device_type=self.chip_id
@@ -1407,11 +1417,7 @@ class DAVIS(USBDevice):
                     num_pol_event += num_events
                 elif packet_type == libcaer.SPECIAL_EVENT:
                     events, num_events = self.get_special_event(packet_header)
-                    special_events = (
-                        np.hstack((special_events, events))
-                        if special_events is not None
-                        else events
-                    )
+                    special_packets.append(events)
                     num_special_event += num_events
                 elif packet_type == libcaer.FRAME_EVENT:
                     frame_mat, frame_ts = self.get_frame_event(
@@ -1423,13 +1429,16 @@ class DAVIS(USBDevice):
                     frames_ts.append(frame_ts)
                 elif packet_type == libcaer.IMU6_EVENT:
                     events, num_events = self.get_imu6_event(packet_header)
-                    imu_events = (
-                        np.hstack((imu_events, events))
-                        if imu_events is not None
-                        else events
-                    )
+                    imu_packets.append(events)
                     num_imu_event += num_events
 
+            if pol_packets:
+                pol_events = np.concatenate(pol_packets, axis=0)
+            if special_packets:
+                special_events = np.concatenate(special_packets, axis=0)
+            if imu_packets:
+                imu_events = np.concatenate(imu_packets, axis=0)
+
             # post processing with frames
             frames = np.array(frames, dtype=np.uint8)
             frames_ts = np.array(frames_ts, dtype=np.uint64)
@@ -4,11 +4,163 @@ Author: Yuhuang Hu
 Email : duguyue100@gmail.com
 """
 import abc
+import queue
+import threading
+
+import numpy as np
 
 from pyaer import libcaer
 
+# size of the prefetch queue if it is not given
+_DEFAULT_PREFETCH_CONTAINERS = 2
+
+
+class _PacketPrefetcher(object):
+    """Background packet container fetching shared by all devices.
+
+    A thread polls `libcaer` for packet containers and puts them into a
+    bounded queue, `get_packet_container` then reads from the queue.
+    The device classes stop the thread in `data_stop` and restore it in
+    `start_data_stream`.
+    """
+
+    # queue size of the last start_prefetch, None if prefetching is off
+    _prefetch_containers = None
+    # data exchange blocking mode before prefetching, restored on stop
+    _prefetch_blocking = None
+    _prefetch_queue = None
+    _prefetch_thread = None
+    _prefetch_stop = None
+
+    def start_prefetch(self, max_containers=_DEFAULT_PREFETCH_CONTAINERS):
+        """Fetch packet containers in a background thread.
+
+        `get_packet_container` then takes the containers from a queue, so that
+        the device transfer of the next container overlaps with decoding the
+        current one. The prefetching stops with `data_stop`, and it is started
+        again by `start_data_stream`, unless that is called with
+        `prefetch=False`.
+
+        # Arguments
+            max_containers: `int`<br/>
+                number of fetched containers that can wait to be read,
+                the thread waits when the queue is full.<br/>
+                `default is 2`
+        """
+        self._prefetch_containers = max_containers
+        if self._prefetch_thread is not None:
+            return
+
+        # the thread polls, so that it notices the stop request without
+        # new data, readers still block on the queue
+        self._prefetch_blocking = self.get_config(
+            libcaer.CAER_HOST_CONFIG_DATAEXCHANGE,
+            libcaer.CAER_HOST_CONFIG_DATAEXCHANGE_BLOCKING,
+        )
+        self.set_data_exchange_blocking(False)
+        self._prefetch_stop = threading.Event()
+        self._prefetch_queue = queue.Queue(maxsize=max_containers)
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_packet_containers, daemon=True
+        )
+        self._prefetch_thread.start()
+
+    def _restore_prefetch(self, prefetch):
+        """Start prefetching for a new data stream.
+
+        # Arguments
+            prefetch: `bool`<br/>
+                start prefetching if True, keep it off if False, and do
+                as the last data stream did if None.
+        """
+        if prefetch is None:
+            prefetch = self._prefetch_containers is not None
+        if prefetch:
+            self.start_prefetch(
+                self._prefetch_containers or _DEFAULT_PREFETCH_CONTAINERS
+            )
+        else:
+            self._prefetch_containers = None
+
+    def _prefetch_packet_containers(self):
+        """Fill the prefetch queue until `_stop_prefetch` is called."""
+        while not self._prefetch_stop.is_set():
+            packet_container = libcaer.caerDeviceDataGet(self.handle)
+            if packet_container is None:
+                self._prefetch_stop.wait(0.001)
+                continue
+            while not self._prefetch_stop.is_set():
+                try:
+                    self._prefetch_queue.put(packet_container, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            else:
+                libcaer.caerEventPacketContainerFree(packet_container)
+
+    def _stop_prefetch(self):
+        """Stop the prefetch thread and wait for it to leave `libcaer`.
+
+        The blocking mode from before the prefetching is restored, and the
+        setting is kept for `_restore_prefetch`.
+
+        # Returns
+            prefetch_queue: `queue.Queue`<br/>
+                the queue of the stopped thread for
+                `_release_prefetch_queue`, None if prefetching was off.
+        """
+        if self._prefetch_thread is None:
+            return None
+
+        self._prefetch_stop.set()
+        self._prefetch_thread.join()
+        prefetch_queue = self._prefetch_queue
+        self._prefetch_thread = None
+        self._prefetch_queue = None
+        if self._prefetch_blocking is not None:
+            self.set_data_exchange_blocking(bool(self._prefetch_blocking))
+            self._prefetch_blocking = None
+
+        return prefetch_queue
+
+    def _release_prefetch_queue(self, prefetch_queue):
+        """Free the containers nobody read and wake up a waiting reader.
+
+        # Arguments
+            prefetch_queue: `queue.Queue`<br/>
+                the queue from `_stop_prefetch`, nothing is done if None.
+        """
+        if prefetch_queue is None:
+            return
 
-class USBDevice(object):
+        while not prefetch_queue.empty():
+            libcaer.caerEventPacketContainerFree(prefetch_queue.get_nowait())
+        prefetch_queue.put(None)
+
+    def _data_get(self):
+        """Get the next packet container.
+
+        # Returns
+            packet_container: `caerEventPacketContainer`<br/>
+                the next container from the prefetch queue if prefetching
+                is on, otherwise straight from `libcaer`. None if there is
+                no container, or if the prefetch thread stopped.
+        """
+        prefetch_queue = self._prefetch_queue
+        if prefetch_queue is None:
+            return libcaer.caerDeviceDataGet(self.handle)
+
+        while True:
+            try:
+                return prefetch_queue.get(timeout=0.1)
+            except queue.Empty:
+                # nothing more comes if the thread died or is being stopped
+                prefetch_thread = self._prefetch_thread
+                if prefetch_thread is None or not prefetch_thread.is_alive():
+                    return None
+
+
+class USBDevice(_PacketPrefetcher):
     """Base class for all USB devices.
 
     This class is the base of DVS128, DAVIS240, DAVIS346 and DYNAPSE.
@@ -149,7 +301,10 @@ class USBDevice(object):
         This method stops the data transmission only. Note that this method does not
         destroy the respective device `handle`.
         """
+        # the prefetch thread must be out of libcaer before the stream stops
+        prefetch_queue = self._stop_prefetch()
         libcaer.caerDeviceDataStop(self.handle)
+        self._release_prefetch_queue(prefetch_queue)
 
     def send_default_config(self):
         """Send default configuration.
@@ -222,6 +377,37 @@ class USBDevice(object):
             exchange_blocking,
         )
 
+    def set_usb_buffer_number(self, buffer_number=8):
+        """Set the number of USB transfers.
+
+        # Arguments
+            buffer_number: `int`<br/>
+                number of USB transfers libcaer keeps in flight to
+                read data from the device. More transfers reduce the
+                chance of dropping data at high event rates.<br/>
+                The default is `8`.
+        """
+        return self.set_config(
+            libcaer.CAER_HOST_CONFIG_USB,
+            libcaer.CAER_HOST_CONFIG_USB_BUFFER_NUMBER,
+            buffer_number,
+        )
+
+    def set_usb_buffer_size(self, buffer_size=8192):
+        """Set the size of each USB transfer.
+
+        # Arguments
+            buffer_size: `int`<br/>
+                size in bytes of each USB transfer used to read data
+                from the device.<br/>
+                The default is `8192`.
+        """
+        return self.set_config(
+            libcaer.CAER_HOST_CONFIG_USB,
+            libcaer.CAER_HOST_CONFIG_USB_BUFFER_SIZE,
+            buffer_size,
+        )
+
     def set_config(self, mod_addr, param_addr, param):
         """Set configuration.
 
@@ -254,6 +440,29 @@ class USBDevice(object):
         else:
             return False
 
+    def set_config_batch(self, configs):
+        """Set a batch of configuration parameters.
+
+        The parameters are written in order within a single call to
+        `libcaer`, which saves a Python round trip per parameter.
+
+        # Arguments
+            configs: `list`<br/>
+                a list of `(mod_addr, param_addr, param)` tuples, each
+                tuple is a set of arguments to `set_config`.
+
+        # Returns
+            flag: `bool`<br/>
+                returns `True` if all the parameters are set successfully,
+                `False` otherwise.
+        """
+        if self.handle is not None:
+            return libcaer.set_config_batch(
+                self.handle, np.array(configs, dtype=np.int64).reshape(-1)
+            )
+        else:
+            return False
+
     def get_config(self, mod_addr, param_addr):
         """Get Configuration.
 
@@ -279,6 +488,32 @@ class USBDevice(object):
         else:
             return None
 
+    def get_config_batch(self, configs):
+        """Get a batch of configuration parameters.
+
+        The parameters are read in order within a single call to
+        `libcaer`, which saves a Python round trip per parameter.
+
+        # Arguments
+            configs: `list`<br/>
+                a list of `(mod_addr, param_addr)` tuples, each tuple is
+                a set of arguments to `get_config`.
+
+        # Returns
+            params: `list`<br/>
+                the configuration parameters' values in the order of
+                `configs`, a value is None if it failed to be read.
+                Returns None if the handle is not valid.
+        """
+        if self.handle is not None:
+            values = libcaer.get_config_batch(
+                self.handle, np.array(configs, dtype=np.int64).reshape(-1), len(configs)
+            )
+            # failed reads are marked with -1
+            return [None if value < 0 else value for value in values.tolist()]
+        else:
+            return None
+
     def get_packet_container(self):
         """Get event packet container.
 
@@ -288,7 +523,7 @@ class USBDevice(object):
             packet_number: `int`<br/>
                 number of event packet in the container.
         """
-        packet_container = libcaer.caerDeviceDataGet(self.handle)
+        packet_container = self._data_get()
         if packet_container is not None:
             packet_number = libcaer.caerEventPacketContainerGetEventPacketsNumber(
                 packet_container
@@ -574,14 +809,14 @@ class USBDevice(object):
             num_events: `int`<br/>
                 the number of the spike events.
         """
-        num_events, spike = self.get_event_packet(packet_header, self.SPIKE_EVENT)
+        num_events, spike = self.get_event_packet(packet_header, libcaer.SPIKE_EVENT)
 
         events = libcaer.get_spike_event(spike, num_events * 4).reshape(num_events, 4)
 
         return events, num_events
 
 
-class SerialDevice(object):
+class SerialDevice(_PacketPrefetcher):
     """Base class for serial devices.
 
     The base class for devices that use the serial port. eDVS is the only current
@@ -694,7 +929,10 @@ class SerialDevice(object):
         This method stops the data transmission only. Note that this method does not
         destroy the respective device `handle`.
         """
+        # the prefetch thread must be out of libcaer before the stream stops
+        prefetch_queue = self._stop_prefetch()
         libcaer.caerDeviceDataStop(self.handle)
+        self._release_prefetch_queue(prefetch_queue)
 
     def send_default_config(self):
         """Send default configuration.
@@ -766,6 +1004,29 @@ class SerialDevice(object):
         else:
             return False
 
+    def set_config_batch(self, configs):
+        """Set a batch of configuration parameters.
+
+        The parameters are written in order within a single call to
+        `libcaer`, which saves a Python round trip per parameter.
+
+        # Arguments
+            configs: `list`<br/>
+                a list of `(mod_addr, param_addr, param)` tuples, each
+                tuple is a set of arguments to `set_config`.
+
+        # Returns
+            flag: `bool`<br/>
+                returns `True` if all the parameters are set successfully,
+                `False` otherwise.
+        """
+        if self.handle is not None:
+            return libcaer.set_config_batch(
+                self.handle, np.array(configs, dtype=np.int64).reshape(-1)
+            )
+        else:
+            return False
+
     def get_config(self, mod_addr, param_addr):
         """Get Configuration.
 
@@ -791,6 +1052,32 @@ class SerialDevice(object):
         else:
             return None
 
+    def get_config_batch(self, configs):
+        """Get a batch of configuration parameters.
+
+        The parameters are read in order within a single call to
+        `libcaer`, which saves a Python round trip per parameter.
+
+        # Arguments
+            configs: `list`<br/>
+                a list of `(mod_addr, param_addr)` tuples, each tuple is
+                a set of arguments to `get_config`.
+
+        # Returns
+            params: `list`<br/>
+                the configuration parameters' values in the order of
+                `configs`, a value is None if it failed to be read.
+                Returns None if the handle is not valid.
+        """
+        if self.handle is not None:
+            values = libcaer.get_config_batch(
+                self.handle, np.array(configs, dtype=np.int64).reshape(-1), len(configs)
+            )
+            # failed reads are marked with -1
+            return [None if value < 0 else value for value in values.tolist()]
+        else:
+            return None
+
     def get_packet_container(self):
         """Get event packet container.
 
@@ -800,7 +1087,7 @@ class SerialDevice(object):
             packet_number: `int`<br/>
                 number of event packet in the container.
         """
-        packet_container = libcaer.caerDeviceDataGet(self.handle)
+        packet_container = self._data_get()
         if packet_container is not None:
             packet_number = libcaer.caerEventPacketContainerGetEventPacketsNumber(
                 packet_container
@@ -861,3 +1148,29 @@ class SerialDevice(object):
         )
 
         return events, num_events
+
+    def get_special_event(self, packet_header):
+        """Get a packet of special event.
+
+        # Arguments
+            packet_header: `caerEventPacketHeader`<br/>
+                the header that represents a event packet
+
+        # Returns
+            events: `numpy.ndarray`<br/>
+                a 2-D array that has the shape of (N, 2) where N
+                is the number of events in the event packet.
+                Each row in the array represents a single special event.
+                The first value is the timestamp of the event.
+                The second value is the special event data.
+            num_events: `int`<br/>
+                number of the special events in the packet.
+        """
+        num_events = libcaer.caerEventPacketHeaderGetEventNumber(packet_header)
+        special = libcaer.caerSpecialEventPacketFromPacketHeader(packet_header)
+
+        events = libcaer.get_special_event(special, num_events * 2).reshape(
+            num_events, 2
+        )
+
+        return events, num_events
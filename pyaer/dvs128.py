@@ -241,7 +241,11 @@ class DVS128(USBDevice):
         return utils.write_json(file_path, bias_obj)
 
     def start_data_stream(
-        self, send_default_config=True, max_packet_size=None, max_packet_interval=None
+        self,
+        send_default_config=True,
+        max_packet_size=None,
+        max_packet_interval=None,
+        prefetch=None,
     ):
         """Start streaming data.
 
@@ -261,6 +265,11 @@ class DVS128(USBDevice):
                 The value is in microseconds, and is checked across all
                 types of events contained in the EventPacketContainer.<br/>
                 The default is `None` (use default setting: 10ms)
+            prefetch: `bool`<br/>
+                fetch packet containers in a background thread,
+                see `start_prefetch`. If None, prefetch as the last
+                data stream did, so that restarts keep the setting.<br/>
+                `default is None`
         """
         if send_default_config is True:
             self.send_default_config()
@@ -272,6 +281,7 @@ class DVS128(USBDevice):
 
         self.data_start()
         self.set_data_exchange_blocking()
+        self._restore_prefetch(prefetch)
 
     def get_polarity_event(self, packet_header, noise_filter=False):
         """Get a packet of polarity event.
@@ -350,6 +360,9 @@ class DVS128(USBDevice):
             num_special_event = 0
             pol_events = None
             special_events = None
+            # collect the packets and stack them once
+            pol_packets = []
+            special_packets = []
             for packet_id in range(packet_number):
                 packet_header, packet_type = self.get_packet_header(
                     packet_container, packet_id
@@ -359,11 +372,7 @@ class DVS128(USBDevice):
                         events, num_events = self.get_polarity_event(
                             packet_header, self.filter_noise
                         )
-                        pol_events = (
-                            np.hstack((pol_events, events))
-                            if pol_events is not None
-                            else events
-                        )
+                        pol_packets.append(events)
                     elif mode == "events_hist":
                         hist, num_events = self.get_polarity_hist(
                             packet_header, device_type="DVS128"
@@ -373,12 +382,13 @@ class DVS128(USBDevice):
                     num_pol_event += num_events
                 elif packet_type == libcaer.SPECIAL_EVENT:
                     events, num_events = self.get_special_event(packet_header)
-                    special_events = (
-                        np.hstack((special_events, events))
-                        if special_events is not None
-                        else events
-                    )
+                    special_packets.append(events)
                     num_special_event += num_events
+            if pol_packets:
+                pol_events = np.concatenate(pol_packets, axis=0)
+            if special_packets:
+                special_events = np.concatenate(special_packets, axis=0)
+
             libcaer.caerEventPacketContainerFree(packet_container)
 
             return (pol_events, num_pol_event, special_events, num_special_event)
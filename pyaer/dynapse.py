@@ -1,9 +1,18 @@
 """DYNAPSE.
 
+Configuring and reading the device is bound by USB latency and Python
+dispatch, not by arithmetic. Repeated work is therefore batched into
+single calls to `libcaer` (see `pyflags.i`) and cached where possible.
+
 Author: Yuhuang Hu
 Email : duguyue100@gmail.com
 """
+import os
 import time
+from collections import namedtuple
+from functools import lru_cache
+from operator import attrgetter
+from operator import itemgetter
 
 import numpy as np
 
@@ -11,6 +20,249 @@ from pyaer import libcaer
 from pyaer import utils
 from pyaer.device import USBDevice
 
+# snapshot of the DYNAPSE info struct, see DYNAPSE.obtain_device_info
+DynapseInfo = namedtuple(
+    "DynapseInfo",
+    [
+        "device_id",
+        "device_serial_number",
+        "device_usb_bus_number",
+        "device_usb_device_address",
+        "device_string",
+        "logic_version",
+        "device_is_master",
+        "logic_clock",
+        "chip_id",
+        "aer_has_statistics",
+        "mux_has_statistics",
+    ],
+)
+
+# all the cores of a chip, and the (chip_id, core_ids) pairs of scope="all"
+_ALL_CORE_IDS = (0, 1, 2, 3)
+_ALL_SCOPE = tuple((chip_id, _ALL_CORE_IDS) for chip_id in range(4))
+
+# chip global neuron addresses indexed as [core_id, row_y, column_x],
+# same layout as libcaer's caerDynapseCoreXYToNeuronId
+_CORE_XY_TO_NEURON_ID = np.arange(1024, dtype=np.uint16).reshape(4, 16, 16)
+
+# core level biases in writing order, each entry is
+# (address suffix, key stem, biasHigh, typeNormal, sexN, enabled)
+_CORE_BIAS_SPECS = (
+    ("IF_BUF_P", "if_buf_p", True, True, False, True),
+    ("IF_RFR_N", "if_rfr_n", True, True, True, True),
+    ("IF_NMDA_N", "if_nmda_n", True, True, True, True),
+    ("IF_DC_P", "if_dc_p", True, True, False, True),
+    ("IF_TAU1_N", "if_tau1", False, True, True, True),
+    ("IF_TAU2_N", "if_tau2", True, True, True, True),
+    ("IF_THR_N", "if_thr_n", True, True, True, True),
+    ("IF_AHW_P", "if_ahw_p", True, True, False, True),
+    ("IF_AHTAU_N", "if_ahtau_n", True, True, True, True),
+    ("IF_AHTHR_N", "if_ahthr_n", True, True, True, True),
+    ("IF_CASC_N", "if_casc_n", True, True, True, True),
+    ("PULSE_PWLK_P", "pulse_pwlk_p", True, True, False, True),
+    ("PS_WEIGHT_INH_S_N", "ps_weight_inh_s_n", True, True, True, True),
+    ("PS_WEIGHT_INH_F_N", "ps_weight_inh_f_n", True, True, True, True),
+    ("PS_WEIGHT_EXC_S_N", "ps_weight_exc_s_n", True, True, True, True),
+    ("PS_WEIGHT_EXC_F_N", "ps_weight_exc_f_n", True, True, True, True),
+    ("NPDPII_TAU_S_P", "npdpii_tau_s_p", True, True, False, True),
+    ("NPDPII_TAU_F_P", "npdpii_tau_f_p", True, True, False, True),
+    ("NPDPII_THR_S_P", "npdpii_thr_s_p", True, True, False, True),
+    ("NPDPII_THR_F_P", "npdpii_thr_f_p", True, True, False, True),
+    ("NPDPIE_TAU_S_P", "npdpie_tau_s_p", True, True, False, True),
+    ("NPDPIE_TAU_F_P", "npdpie_tau_f_p", True, True, False, True),
+    ("NPDPIE_THR_S_P", "npdpie_thr_s_p", True, True, False, True),
+    ("NPDPIE_THR_F_P", "npdpie_thr_f_p", True, True, False, True),
+    ("R2R_P", "r2r_p", True, True, False, True),
+)
+
+# biases for all the cores, same layout as _CORE_BIAS_SPECS
+# but with resolved addresses
+_GLOBAL_BIAS_SPECS = (
+    (libcaer.DYNAPSE_CONFIG_BIAS_D_BUFFER, "d_buffer", True, True, False, True),
+    (libcaer.DYNAPSE_CONFIG_BIAS_D_SSP, "d_ssp", True, True, False, True),
+    (libcaer.DYNAPSE_CONFIG_BIAS_D_SSN, "d_ssn", True, True, False, True),
+    (libcaer.DYNAPSE_CONFIG_BIAS_U_BUFFER, "u_buffer", True, True, False, True),
+    (libcaer.DYNAPSE_CONFIG_BIAS_U_SSP, "u_ssp", True, True, False, True),
+    (libcaer.DYNAPSE_CONFIG_BIAS_U_SSN, "u_ssn", True, True, False, True),
+)
+
+# bias rows for libcaer.set_dynapse_bias_multi, the columns are
+# (address, coarse, fine, biasHigh, typeNormal, sexN, enabled), the
+# coarse and fine columns are filled in from the bias dictionary
+_CORE_BIAS_ROWS = np.array(
+    [
+        [
+            (
+                getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C{}_{}".format(core_id, spec[0])),
+                0,
+                0,
+            )
+            + spec[2:]
+            for spec in _CORE_BIAS_SPECS
+        ]
+        for core_id in range(4)
+    ],
+    dtype=np.uint8,
+)
+_GLOBAL_BIAS_ROWS = np.array(
+    [(spec[0], 0, 0) + spec[2:] for spec in _GLOBAL_BIAS_SPECS], dtype=np.uint8
+)
+
+# (coarse, fine) bias keys matching the bias rows
+_CORE_BIAS_VALUE_KEYS = tuple(
+    tuple(
+        (
+            "c{}_{}_coarse".format(core_id, spec[1]),
+            "c{}_{}_fine".format(core_id, spec[1]),
+        )
+        for spec in _CORE_BIAS_SPECS
+    )
+    for core_id in range(4)
+)
+_GLOBAL_BIAS_VALUE_KEYS = tuple(
+    (spec[1] + "_coarse", spec[1] + "_fine") for spec in _GLOBAL_BIAS_SPECS
+)
+
+# bias keys required by set_bias, checked before anything is written
+_CORE_BIAS_KEYS = tuple(frozenset(sum(keys, ())) for keys in _CORE_BIAS_VALUE_KEYS)
+_GLOBAL_BIAS_KEYS = frozenset(sum(_GLOBAL_BIAS_VALUE_KEYS, ()))
+
+# getters of the flat (coarse, fine, coarse, fine, ...) bias values
+_CORE_BIAS_VALUE_GETTERS = tuple(
+    itemgetter(*sum(keys, ())) for keys in _CORE_BIAS_VALUE_KEYS
+)
+_GLOBAL_BIAS_VALUE_GETTER = itemgetter(*sum(_GLOBAL_BIAS_VALUE_KEYS, ()))
+
+# FPGA biases as (key, module address, parameter address)
+_FPGA_BIAS_CONFIGS = (
+    # DYNAPSE_CONFIG_MUX
+    (
+        "mux_timestamp_reset",
+        libcaer.DYNAPSE_CONFIG_MUX,
+        libcaer.DYNAPSE_CONFIG_MUX_TIMESTAMP_RESET,
+    ),
+    (
+        "mux_force_chip_bias_enable",
+        libcaer.DYNAPSE_CONFIG_MUX,
+        libcaer.DYNAPSE_CONFIG_MUX_FORCE_CHIP_BIAS_ENABLE,
+    ),
+    (
+        "mux_drop_aer_on_transfer_stall",
+        libcaer.DYNAPSE_CONFIG_MUX,
+        libcaer.DYNAPSE_CONFIG_MUX_DROP_AER_ON_TRANSFER_STALL,
+    ),
+    # DYNAPSE_CONFIG_AER
+    (
+        "aer_ack_delay",
+        libcaer.DYNAPSE_CONFIG_AER,
+        libcaer.DYNAPSE_CONFIG_AER_ACK_DELAY,
+    ),
+    (
+        "aer_ack_extension",
+        libcaer.DYNAPSE_CONFIG_AER,
+        libcaer.DYNAPSE_CONFIG_AER_ACK_EXTENSION,
+    ),
+    (
+        "aer_wait_on_transfer_stall",
+        libcaer.DYNAPSE_CONFIG_AER,
+        libcaer.DYNAPSE_CONFIG_AER_WAIT_ON_TRANSFER_STALL,
+    ),
+    (
+        "aer_external_aer_control",
+        libcaer.DYNAPSE_CONFIG_AER,
+        libcaer.DYNAPSE_CONFIG_AER_EXTERNAL_AER_CONTROL,
+    ),
+    # DYNAPSE_CONFIG_CHIP
+    (
+        "chip_req_delay",
+        libcaer.DYNAPSE_CONFIG_CHIP,
+        libcaer.DYNAPSE_CONFIG_CHIP_REQ_DELAY,
+    ),
+    (
+        "chip_req_extension",
+        libcaer.DYNAPSE_CONFIG_CHIP,
+        libcaer.DYNAPSE_CONFIG_CHIP_REQ_EXTENSION,
+    ),
+    # DYNAPSE_CONFIG_USB
+    (
+        "usb_early_packet_delay",
+        libcaer.DYNAPSE_CONFIG_USB,
+        libcaer.DYNAPSE_CONFIG_USB_EARLY_PACKET_DELAY,
+    ),
+)
+_FPGA_BIAS_KEYS = frozenset(config[0] for config in _FPGA_BIAS_CONFIGS)
+
+
+@lru_cache(maxsize=64)
+def _encode_bias_rows(bias_rows):
+    """Encode packed bias rows into bias words.
+
+    # Arguments
+        bias_rows: `bytes`<br/>
+            raw bytes of a `uint8` bias row array, see `_CORE_BIAS_ROWS`.
+
+    # Returns
+        bias_words: `numpy.ndarray`<br/>
+            read-only `uint32` array of the encoded bias words, shared
+            between calls with the same biases.
+    """
+    bias_words = libcaer.set_dynapse_bias_multi(
+        np.frombuffer(bias_rows, dtype=np.uint8), len(bias_rows) // 7
+    )
+    bias_words.flags.writeable = False
+
+    return bias_words
+
+
+@lru_cache(maxsize=32)
+def _load_bias_cached(file_path, mtime):
+    """Load a DYNAPSE bias file once per modification time.
+
+    # Arguments
+        file_path: `str`<br/>
+            absolute path of the JSON bias file.
+        mtime: `float`<br/>
+            modification time of the file, part of the cache key so that
+            an edited file is parsed again.
+
+    # Returns
+        bias_obj: `dict`<br/>
+            the parsed bias dictionary, shared between calls.
+    """
+    return utils.load_dynapse_bias(file_path)
+
+
+def _info_property(field):
+    """Read-only attribute that reads a field of the device info snapshot."""
+    return property(attrgetter("info." + field))
+
+
+def _check_address_range(values, high, name):
+    """Check that an array of addresses is in [0, high].
+
+    Negative addresses would otherwise wrap around when indexing
+    `_CORE_XY_TO_NEURON_ID`, e.g., core -1 would become core 3, and
+    out-of-range addresses would wrap when they are cast to the unsigned
+    types of the batch writers.
+
+    # Arguments
+        values: `numpy.ndarray`<br/>
+            the addresses, any array-like is accepted.
+        high: `int`<br/>
+            the largest valid address.
+        name: `str`<br/>
+            name of the addresses for the error message.
+
+    # Returns
+        values: `numpy.ndarray`<br/>
+            the addresses as an array.
+    """
+    values = np.asarray(values)
+    if np.any((values < 0) | (values > high)):
+        raise ValueError("%s must be in [0, %d]" % (name, high))
+    return values
+
 
 class DYNAPSE(USBDevice):
     """DYNAPSE.
@@ -36,6 +288,41 @@ class DYNAPSE(USBDevice):
             `default is ""`
     """
 
+    # seconds to wait for the chips once the data stream is stopped
+    # and once the biases are written, libcaer exposes no readiness flag
+    # so lower them only for setups that are known to settle faster
+    STREAM_STOP_DELAY = 1.0
+    BIAS_SETTLE_DELAY = 1.0
+
+    # jump directions
+    DYNAPSE_CONFIG_SRAM_DIRECTION_X_EAST = libcaer.DYNAPSE_CONFIG_SRAM_DIRECTION_X_EAST
+    DYNAPSE_CONFIG_SRAM_DIRECTION_X_WEST = libcaer.DYNAPSE_CONFIG_SRAM_DIRECTION_X_WEST
+    DYNAPSE_CONFIG_SRAM_DIRECTION_Y_NORTH = (
+        libcaer.DYNAPSE_CONFIG_SRAM_DIRECTION_Y_NORTH
+    )
+    DYNAPSE_CONFIG_SRAM_DIRECTION_Y_SOUTH = (
+        libcaer.DYNAPSE_CONFIG_SRAM_DIRECTION_Y_SOUTH
+    )
+
+    # synaptic weights
+    DYNAPSE_CONFIG_CAMTYPE_F_EXC = libcaer.DYNAPSE_CONFIG_CAMTYPE_F_EXC
+    DYNAPSE_CONFIG_CAMTYPE_S_EXC = libcaer.DYNAPSE_CONFIG_CAMTYPE_S_EXC
+    DYNAPSE_CONFIG_CAMTYPE_F_INH = libcaer.DYNAPSE_CONFIG_CAMTYPE_F_INH
+    DYNAPSE_CONFIG_CAMTYPE_S_INH = libcaer.DYNAPSE_CONFIG_CAMTYPE_S_INH
+
+    # device information from the info struct
+    device_id = _info_property("device_id")
+    device_serial_number = _info_property("device_serial_number")
+    device_usb_bus_number = _info_property("device_usb_bus_number")
+    device_usb_device_address = _info_property("device_usb_device_address")
+    device_string = _info_property("device_string")
+    logic_version = _info_property("logic_version")
+    device_is_master = _info_property("device_is_master")
+    logic_clock = _info_property("logic_clock")
+    chip_id = _info_property("chip_id")
+    aer_has_statistics = _info_property("aer_has_statistics")
+    mux_has_statistics = _info_property("mux_has_statistics")
+
     def __init__(
         self,
         device_id=1,
@@ -50,25 +337,14 @@ class DYNAPSE(USBDevice):
         # get camera info
         self.obtain_device_info(self.handle)
 
-        # jump directions
-        self.DYNAPSE_CONFIG_SRAM_DIRECTION_X_EAST = (
-            libcaer.DYNAPSE_CONFIG_SRAM_DIRECTION_X_EAST
-        )
-        self.DYNAPSE_CONFIG_SRAM_DIRECTION_X_WEST = (
-            libcaer.DYNAPSE_CONFIG_SRAM_DIRECTION_X_WEST
-        )
-        self.DYNAPSE_CONFIG_SRAM_DIRECTION_Y_NORTH = (
-            libcaer.DYNAPSE_CONFIG_SRAM_DIRECTION_Y_NORTH
-        )
-        self.DYNAPSE_CONFIG_SRAM_DIRECTION_Y_SOUTH = (
-            libcaer.DYNAPSE_CONFIG_SRAM_DIRECTION_Y_SOUTH
-        )
+        # (path, bias hash, mtime) of the last save_fpga_bias_to_json
+        self._saved_fpga_bias = None
+
+        # settle deadline of a non-blocking set_bias, see wait_stable
+        self._stable_at = None
 
-        # synaptic weights
-        self.DYNAPSE_CONFIG_CAMTYPE_F_EXC = libcaer.DYNAPSE_CONFIG_CAMTYPE_F_EXC
-        self.DYNAPSE_CONFIG_CAMTYPE_S_EXC = libcaer.DYNAPSE_CONFIG_CAMTYPE_S_EXC
-        self.DYNAPSE_CONFIG_CAMTYPE_F_INH = libcaer.DYNAPSE_CONFIG_CAMTYPE_F_INH
-        self.DYNAPSE_CONFIG_CAMTYPE_S_INH = libcaer.DYNAPSE_CONFIG_CAMTYPE_S_INH
+        # reusable buffer for get_event(copy=False)
+        self._spike_buffer = np.empty((0, 4), dtype=np.int64)
 
         # chip configurations
         self.chip_config = [
@@ -94,6 +370,9 @@ class DYNAPSE(USBDevice):
         - If the device has AER statistics
         - If the device has MUX statistics
 
+        The fields are stored together in `info`, a `DynapseInfo` named
+        tuple, and can also be read as attributes, e.g., `device_id`.
+
         # Arguments
             handle: `caerDeviceHandle`<br/>
                 a valid device handle that can be used with the other
@@ -101,19 +380,19 @@ class DYNAPSE(USBDevice):
         """
         if handle is not None:
             info = libcaer.caerDynapseInfoGet(handle)
-
-            # port all info data fields out
-            self.device_id = info.deviceID
-            self.device_serial_number = info.deviceSerialNumber
-            self.device_usb_bus_number = info.deviceUSBBusNumber
-            self.device_usb_device_address = info.deviceUSBDeviceAddress
-            self.device_string = info.deviceString
-            self.logic_version = info.logicVersion
-            self.device_is_master = info.deviceIsMaster
-            self.logic_clock = info.logicClock
-            self.chip_id = info.chipID
-            self.aer_has_statistics = info.aerHasStatistics
-            self.mux_has_statistics = info.muxHasStatistics
+            self.info = DynapseInfo(
+                device_id=info.deviceID,
+                device_serial_number=info.deviceSerialNumber,
+                device_usb_bus_number=info.deviceUSBBusNumber,
+                device_usb_device_address=info.deviceUSBDeviceAddress,
+                device_string=info.deviceString,
+                logic_version=info.logicVersion,
+                device_is_master=info.deviceIsMaster,
+                logic_clock=info.logicClock,
+                chip_id=info.chipID,
+                aer_has_statistics=info.aerHasStatistics,
+                mux_has_statistics=info.muxHasStatistics,
+            )
 
     def open(
         self,
@@ -151,6 +430,55 @@ class DYNAPSE(USBDevice):
             dev_address_restrict,
             serial_number,
         )
+        self.invalidate_config_cache()
+
+    def invalidate_config_cache(self):
+        """Drop the cached FPGA bias reads.
+
+        `get_fpga_bias` caches the values it reads from the device, the
+        cache is kept up to date by the configuration methods of this
+        class. Call this function if the device is configured by other
+        means, e.g., calling `libcaer` directly.
+        """
+        self._fpga_bias_cache = {}
+
+    def send_default_config(self):
+        """Send default configuration.
+
+        Same as `USBDevice.send_default_config`, and drops the cached
+        FPGA bias reads.
+        """
+        self.invalidate_config_cache()
+        return super(DYNAPSE, self).send_default_config()
+
+    def set_config(self, mod_addr, param_addr, param):
+        """Set configuration.
+
+        Same as `USBDevice.set_config`, and drops the cached read of
+        the parameter.
+        """
+        self._fpga_bias_cache.pop((mod_addr, param_addr), None)
+        return super(DYNAPSE, self).set_config(mod_addr, param_addr, param)
+
+    def set_config_batch(self, configs):
+        """Set a batch of configuration parameters.
+
+        Same as `USBDevice.set_config_batch`, and drops the cached reads
+        of the parameters.
+        """
+        for mod_addr, param_addr, _ in configs:
+            self._fpga_bias_cache.pop((mod_addr, param_addr), None)
+        return super(DYNAPSE, self).set_config_batch(configs)
+
+    def data_stop(self):
+        """Stop data transmission.
+
+        Same as `USBDevice.data_stop`, and drops a pending non-blocking
+        `set_bias`, so that `wait_stable` does not start the stopped
+        data stream again.
+        """
+        self._stable_at = None
+        super(DYNAPSE, self).data_stop()
 
     def set_bias_from_json(
         self,
@@ -160,6 +488,8 @@ class DYNAPSE(USBDevice):
         setup_sram=False,
         scope="all",
         verbose=False,
+        block=True,
+        live=False,
     ):
         """Set bias from loading JSON configuration file.
 
@@ -188,83 +518,74 @@ class DYNAPSE(USBDevice):
                     3: [0, 1, 2, 3],
                     }
                 ```
+            block: `bool`<br/>
+                see `set_bias`,<br/>
+                `default is True`
+            live: `bool`<br/>
+                see `set_bias`,<br/>
+                `default is False`
         """
-        bias_obj = utils.load_dynapse_bias(file_path, verbose)
+        file_path = os.path.abspath(file_path)
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            mtime = None
+        if verbose or mtime is None:
+            bias_obj = utils.load_dynapse_bias(file_path, verbose)
+        else:
+            # reuse the parsed file until it is modified, the copy keeps
+            # the cached biases safe from the caller
+            bias_obj = _load_bias_cached(file_path, mtime)
+            if bias_obj is not None:
+                bias_obj = dict(bias_obj)
         self.set_bias(
             bias_obj,
             fpga_bias=fpga_bias,
             clear_sram=clear_sram,
             setup_sram=setup_sram,
             scope=scope,
+            block=block,
+            live=live,
         )
 
     def clear_sram(self):
         """Clear SRAM for all chips."""
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_ID,
-            libcaer.DYNAPSE_CONFIG_DYNAPSE_U0,
-        )
-        self.set_config(libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM_EMPTY, 0, 0)
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_ID,
-            libcaer.DYNAPSE_CONFIG_DYNAPSE_U1,
-        )
-        self.set_config(libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM_EMPTY, 0, 0)
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_ID,
-            libcaer.DYNAPSE_CONFIG_DYNAPSE_U2,
-        )
-        self.set_config(libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM_EMPTY, 0, 0)
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_ID,
-            libcaer.DYNAPSE_CONFIG_DYNAPSE_U3,
-        )
-        self.set_config(libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM_EMPTY, 0, 0)
+        self.wait_stable()
+        self._config_sram(clear_sram=True, setup_sram=False)
 
     def setup_sram(self):
         """Setup SRAM for all chips."""
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_ID,
-            libcaer.DYNAPSE_CONFIG_DYNAPSE_U0,
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM, libcaer.DYNAPSE_CONFIG_DYNAPSE_U0, 0
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_ID,
-            libcaer.DYNAPSE_CONFIG_DYNAPSE_U1,
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM, libcaer.DYNAPSE_CONFIG_DYNAPSE_U1, 0
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_ID,
-            libcaer.DYNAPSE_CONFIG_DYNAPSE_U2,
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM, libcaer.DYNAPSE_CONFIG_DYNAPSE_U2, 0
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_ID,
-            libcaer.DYNAPSE_CONFIG_DYNAPSE_U3,
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM, libcaer.DYNAPSE_CONFIG_DYNAPSE_U3, 0
-        )
+        self.wait_stable()
+        self._config_sram(clear_sram=False, setup_sram=True)
+
+    def _config_sram(self, clear_sram, setup_sram):
+        """Clear and/or setup SRAM for all chips in a single pass.
+
+        Each chip is selected once, so doing both takes one `CHIP_ID`
+        write per chip instead of two.
+
+        # Arguments
+            clear_sram: `bool`<br/>
+                Clear SRAM if truthy, skip otherwise
+            setup_sram: `bool`<br/>
+                Setup SRAM for USB monitoring if truthy, skip otherwise
+        """
+        chip_mod = libcaer.DYNAPSE_CONFIG_CHIP
+        chip_id_param = libcaer.DYNAPSE_CONFIG_CHIP_ID
+        configs = []
+        for chip_id in self.chip_config:
+            configs.append((chip_mod, chip_id_param, chip_id))
+            if clear_sram:
+                configs.append((libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM_EMPTY, 0, 0))
+            if setup_sram:
+                configs.append((libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM, chip_id, 0))
+        self.set_config_batch(configs)
 
     def set_chip_bias(
         self,
         bias_obj,
         chip_id,
-        core_ids=[0, 1, 2, 3],
+        core_ids=_ALL_CORE_IDS,
         clear_sram=False,
         setup_sram=False,
     ):
@@ -277,69 +598,87 @@ class DYNAPSE(USBDevice):
                 chip id is between 0-3
             core_ids: `list`<br/>
                 list of core ids from 0 to 3, each element is a string,
-                the default is `[0, 1, 2, 3]`<br/>
+                the default is `(0, 1, 2, 3)`<br/>
                 e.g.,<br/>
                     - `[0, 3]`: set core 0 and core 3<br/>
                     - `[2]`: set core 2<br/>
                     - `[]`: do not set core level biases
             clear_sram: `bool`<br/>
-                Clear SRAM if True, False otherwise,<br/>
+                Clear SRAM if truthy, skip otherwise,<br/>
                 `default is False`
             setup_sram: bool<br/>
-                Setup SRAM if True, False otherwise,<br/>
+                Setup SRAM if truthy, skip otherwise,<br/>
                 `default is False`
         """
+        # fail before the chip is partially configured, the checked
+        # values are packed later on
+        bias_core_ids = sorted(set(core_ids))
+        bias_values = self._check_bias_keys(bias_obj, bias_core_ids)
+        # finish a pending non-blocking configuration first
+        self.wait_stable()
+
         # stop data stream
         self.data_stop()
-        time.sleep(1)
+        self._wait_for_chip(self.STREAM_STOP_DELAY)
+
+        chip_mod = libcaer.DYNAPSE_CONFIG_CHIP
+        aer_mod = libcaer.DYNAPSE_CONFIG_AER
+        chip = self.chip_config[chip_id]
 
         # Turn on chip and AER communication for configuration.
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_RUN, True
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_AER, libcaer.DYNAPSE_CONFIG_AER_RUN, True
+        self.set_config_batch(
+            [
+                (chip_mod, libcaer.DYNAPSE_CONFIG_CHIP_RUN, True),
+                (aer_mod, libcaer.DYNAPSE_CONFIG_AER_RUN, True),
+            ]
         )
 
         # Clear all SRAM
-        if clear_sram is True:
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_ID,
-                self.chip_config[chip_id],
+        if clear_sram:
+            self.set_config_batch(
+                [
+                    (chip_mod, libcaer.DYNAPSE_CONFIG_CHIP_ID, chip),
+                    (libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM_EMPTY, 0, 0),
+                ]
             )
-            self.set_config(libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM_EMPTY, 0, 0)
 
         # set chip bias
-        self.set_activity_bias(bias_obj, self.chip_config[chip_id], core_ids=core_ids)
+        self._write_activity_bias(
+            chip, self._pack_activity_bias(bias_values, bias_core_ids), core_ids
+        )
 
         # Setup SRAM for USB monitoring of spike events
-        if setup_sram is True:
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_ID,
-                self.chip_config[chip_id],
-            )
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM, self.chip_config[chip_id], 0
+        if setup_sram:
+            self.set_config_batch(
+                [
+                    (chip_mod, libcaer.DYNAPSE_CONFIG_CHIP_ID, chip),
+                    (libcaer.DYNAPSE_CONFIG_DEFAULT_SRAM, chip, 0),
+                ]
             )
-            self.setup_sram()
+            self._config_sram(clear_sram=False, setup_sram=True)
 
         # Turn off chip/AER once done
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_RUN, False
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_AER, libcaer.DYNAPSE_CONFIG_AER_RUN, False
+        self.set_config_batch(
+            [
+                (chip_mod, libcaer.DYNAPSE_CONFIG_CHIP_RUN, False),
+                (aer_mod, libcaer.DYNAPSE_CONFIG_AER_RUN, False),
+            ]
         )
 
         # Essential: wait for chip to be stable
-        time.sleep(1)
+        self._wait_for_chip(self.BIAS_SETTLE_DELAY)
         # restart data stream
         self.start_data_stream(send_default_config=False)
 
     def set_bias(
-        self, bias_obj, fpga_bias=True, clear_sram=False, setup_sram=False, scope="all"
+        self,
+        bias_obj,
+        fpga_bias=True,
+        clear_sram=False,
+        setup_sram=False,
+        scope="all",
+        block=True,
+        live=False,
     ):
         """Set bias from bias dictionary.
 
@@ -350,13 +689,13 @@ class DYNAPSE(USBDevice):
             bias_obj: `dict`<br/>
                 dictionary that contains DYNAPSE biases.
             fpga_bias: `bool`<br/>
-                Set FPGA biases if True, False otherwise,<br/>
+                Set FPGA biases if truthy, skip otherwise,<br/>
                 `default is True`
             clear_sram: `bool`<br/>
-                Clear SRAM if True, False otherwise,<br/>
+                Clear SRAM if truthy, skip otherwise,<br/>
                 `default is False`
             setup_sram: `bool`<br/>
-                Setup SRAM if True, False otherwise,<br/>
+                Setup SRAM if truthy, skip otherwise,<br/>
                 `default is False`
             scope: `str, dict`<br/>
                 a dictionary that describe the bias setting profile,
@@ -371,130 +710,258 @@ class DYNAPSE(USBDevice):
                     3: [0, 1, 2, 3],
                     }
                 ```
+            block: `bool`<br/>
+                Wait for the chips to be stable and restart the data
+                stream before returning if True. Otherwise return right
+                away and leave both to `wait_stable`, so that the settle
+                time can be spent on host-side work, e.g., preparing the
+                network. The chips are stopped until then, so `get_event`
+                and the `write_*` methods call `wait_stable` first,<br/>
+                `default is True`
+            live: `bool`<br/>
+                Write the biases while the chips keep running if True.
+                The data stream is not stopped and there is no settle
+                time, which suits tweaking bias values. Only use it when
+                the routing does not change, SRAM can not be cleared or
+                setup in this mode,<br/>
+                `default is False`
 
         # Returns
             flag: `bool`<br/>
                 True if set successful, False otherwise.
         """
+        # finish a pending non-blocking configuration first
+        self.wait_stable()
+
+        if scope == "all":
+            scope_items = _ALL_SCOPE
+            scope_core_ids = _ALL_CORE_IDS
+        else:
+            # make sure the chip description is a dictionary
+            assert isinstance(scope, dict)
+            scope_items = scope.items()
+            scope_core_ids = sorted(set().union(*scope.values()))
+
+        # fail before the chips are partially configured, the checked
+        # values are packed later on
+        bias_values = self._check_bias_keys(bias_obj, scope_core_ids, fpga_bias)
+
+        if live:
+            if clear_sram or setup_sram:
+                raise ValueError("SRAM can not be cleared or setup with live=True")
+
+            # the chips keep running, only the bias values are rewritten
+            flag = self.set_fpga_bias(bias_obj) if fpga_bias else True
+            return (
+                self._write_scope_bias(bias_values, scope_items, scope_core_ids)
+                and flag
+            )
+
+        chip_mod = libcaer.DYNAPSE_CONFIG_CHIP
+        aer_mod = libcaer.DYNAPSE_CONFIG_AER
+
         # stop data stream
         self.data_stop()
-        time.sleep(1)
+        self._wait_for_chip(self.STREAM_STOP_DELAY)
 
         # set FPGA biases
-        if fpga_bias is True:
-            self.set_fpga_bias(bias_obj)
+        flag = self.set_fpga_bias(bias_obj) if fpga_bias else True
 
         # Turn on chip and AER communication for configuration.
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_RUN, True
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_AER, libcaer.DYNAPSE_CONFIG_AER_RUN, True
+        self.set_config_batch(
+            [
+                (chip_mod, libcaer.DYNAPSE_CONFIG_CHIP_RUN, True),
+                (aer_mod, libcaer.DYNAPSE_CONFIG_AER_RUN, True),
+            ]
         )
 
-        # Clear all SRAM
-        if clear_sram is True:
-            self.clear_sram()
-
-        if scope == "all":
-            scope = {
-                0: [0, 1, 2, 3],
-                1: [0, 1, 2, 3],
-                2: [0, 1, 2, 3],
-                3: [0, 1, 2, 3],
-            }
-        else:
-            # make sure the chip description is a dictionary
-            assert isinstance(scope, dict)
+        # Clear all SRAM, and set it up in the same pass over the chips
+        # if both are requested
+        if clear_sram:
+            self._config_sram(clear_sram=True, setup_sram=setup_sram)
 
         # Set biases for some activity
-        for (chip_id, core_ids) in scope.items():
-            self.set_activity_bias(
-                bias_obj, self.chip_config[chip_id], core_ids=core_ids
-            )
+        flag = self._write_scope_bias(bias_values, scope_items, scope_core_ids) and flag
 
         # Setup SRAM for USB monitoring of spike events
-        if setup_sram is True:
-            self.setup_sram()
+        if setup_sram and not clear_sram:
+            self._config_sram(clear_sram=False, setup_sram=True)
 
         # Turn off chip/AER once done
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_RUN, False
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_AER, libcaer.DYNAPSE_CONFIG_AER_RUN, False
+        self.set_config_batch(
+            [
+                (chip_mod, libcaer.DYNAPSE_CONFIG_CHIP_RUN, False),
+                (aer_mod, libcaer.DYNAPSE_CONFIG_AER_RUN, False),
+            ]
         )
 
-        # Essential: wait for chip to be stable
-        time.sleep(1)
+        if block:
+            # Essential: wait for chip to be stable
+            self._wait_for_chip(self.BIAS_SETTLE_DELAY)
+            # restart data stream
+            self.start_data_stream(send_default_config=False)
+        else:
+            self._stable_at = time.monotonic() + self.BIAS_SETTLE_DELAY
+
+        return flag
+
+    def _write_scope_bias(self, bias_values, scope_items, scope_core_ids):
+        """Write activity biases to the chips in a scope.
+
+        # Arguments
+            bias_values: `numpy.ndarray`<br/>
+                activity bias values from `_get_bias_values`.
+            scope_items: `iterable`<br/>
+                (chip id, core ids) pairs to write the biases to.
+            scope_core_ids: `list`<br/>
+                all the core ids in the scope, sorted and unique.
+
+        # Returns
+            flag: `bool`<br/>
+                True if all the chips are set successfully, False otherwise.
+        """
+        # the bias words are packed once and shared by all the chips
+        bias_words = self._pack_activity_bias(bias_values, scope_core_ids)
+        write_activity_bias = self._write_activity_bias
+        chip_config = self.chip_config
+        flag = True
+        for (chip_id, core_ids) in scope_items:
+            flag = (
+                write_activity_bias(chip_config[chip_id], bias_words, core_ids) and flag
+            )
+        return flag
+
+    def wait_stable(self):
+        """Wait for the chips to be stable after a non-blocking `set_bias`.
+
+        The data stream is restarted once the chips are stable. Nothing
+        is done if there is no pending `set_bias`, or if the data stream
+        was stopped with `data_stop` or `shutdown` since. `get_event` and the
+        SRAM, CAM and spike rate writers call this before they access
+        the device.
+        """
+        if self._stable_at is None:
+            return
+        self._wait_for_chip(self._stable_at - time.monotonic())
+        self._stable_at = None
         # restart data stream
         self.start_data_stream(send_default_config=False)
 
-    def set_fpga_bias(self, bias_obj):
-        """Set FPGA biases.
+    def _check_bias_keys(self, bias_obj, core_ids, fpga_bias=False):
+        """Check that a bias dictionary has all the required biases.
 
         # Arguments
             bias_obj: `dict`<br/>
-                dictionary that contains FPGA biases for the device.
+                dictionary that contains DYNAPSE biases.
+            core_ids: `iterable`<br/>
+                core ids from 0 to 3 whose core level biases are required.
+            fpga_bias: `bool`<br/>
+                FPGA biases are required if True.
+
+        # Returns
+            bias_values: `numpy.ndarray`<br/>
+                the checked activity bias values, see `_get_bias_values`.
+
+        A `ValueError` that lists the missing biases is raised if the
+        dictionary is incomplete.
         """
-        # DYNAPSE_CONFIG_MUX
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_MUX,
-            libcaer.DYNAPSE_CONFIG_MUX_TIMESTAMP_RESET,
-            bias_obj["mux_timestamp_reset"],
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_MUX,
-            libcaer.DYNAPSE_CONFIG_MUX_FORCE_CHIP_BIAS_ENABLE,
-            bias_obj["mux_force_chip_bias_enable"],
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_MUX,
-            libcaer.DYNAPSE_CONFIG_MUX_DROP_AER_ON_TRANSFER_STALL,
-            bias_obj["mux_drop_aer_on_transfer_stall"],
-        )
+        # make sure the core ids are in the range
+        assert all(0 <= c <= 3 for c in core_ids), "invalid core_ids=%s" % (core_ids,)
 
-        # DYNAPSE_CONFIG_AER
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_AER,
-            libcaer.DYNAPSE_CONFIG_AER_ACK_DELAY,
-            bias_obj["aer_ack_delay"],
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_AER,
-            libcaer.DYNAPSE_CONFIG_AER_ACK_EXTENSION,
-            bias_obj["aer_ack_extension"],
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_AER,
-            libcaer.DYNAPSE_CONFIG_AER_WAIT_ON_TRANSFER_STALL,
-            bias_obj["aer_wait_on_transfer_stall"],
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_AER,
-            libcaer.DYNAPSE_CONFIG_AER_EXTERNAL_AER_CONTROL,
-            bias_obj["aer_external_aer_control"],
-        )
+        required_keys = set(_GLOBAL_BIAS_KEYS)
+        for core_id in core_ids:
+            required_keys |= _CORE_BIAS_KEYS[core_id]
+        if fpga_bias:
+            required_keys |= _FPGA_BIAS_KEYS
+
+        missing_keys = required_keys.difference(bias_obj.keys())
+        if missing_keys:
+            raise ValueError(
+                "The bias object is missing %d biases: %s"
+                % (len(missing_keys), ", ".join(sorted(missing_keys)))
+            )
 
-        # DYNAPSE_CONFIG_CHIP
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_REQ_DELAY,
-            bias_obj["chip_req_delay"],
-        )
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_REQ_EXTENSION,
-            bias_obj["chip_req_extension"],
+        # the values are checked by reading them
+        return self._get_bias_values(bias_obj, core_ids)
+
+    def _get_bias_values(self, bias_obj, core_ids):
+        """Read the coarse and fine activity bias values.
+
+        # Arguments
+            bias_obj: `dict`<br/>
+                dictionary that contains activity biases.
+            core_ids: `iterable`<br/>
+                core ids from 0 to 3 to read the core level biases for.
+
+        # Returns
+            bias_values: `numpy.ndarray`<br/>
+                a 2-D array that has the shape of (N, 2), each row is
+                the (coarse, fine) value of a bias, in the order of the
+                core biases of each core followed by the global biases.
+
+        A `ValueError` that lists the biases is raised if a coarse value
+        is not in [0, 7] or a fine value is not in [0, 255].
+        """
+        bias_values = []
+        for core_id in core_ids:
+            bias_values.extend(_CORE_BIAS_VALUE_GETTERS[core_id](bias_obj))
+        bias_values.extend(_GLOBAL_BIAS_VALUE_GETTER(bias_obj))
+        bias_values = np.reshape(bias_values, (-1, 2))
+
+        # the biases are packed into uint8 rows, which would silently
+        # wrap values that are out of range
+        invalid = (
+            (bias_values[:, 0] < 0)
+            | (bias_values[:, 0] > 7)
+            | (bias_values[:, 1] < 0)
+            | (bias_values[:, 1] > 255)
         )
+        if invalid.any():
+            value_keys = sum(
+                (_CORE_BIAS_VALUE_KEYS[core_id] for core_id in core_ids), ()
+            )
+            value_keys += _GLOBAL_BIAS_VALUE_KEYS
+            raise ValueError(
+                "Coarse biases must be in [0, 7] and fine biases in [0, 255]: %s"
+                % ", ".join(
+                    "%s=%s, %s=%s" % (coarse_key, coarse, fine_key, fine)
+                    for (coarse_key, fine_key), (coarse, fine) in zip(
+                        np.array(value_keys)[invalid], bias_values[invalid]
+                    )
+                )
+            )
+
+        return bias_values
+
+    def _wait_for_chip(self, delay):
+        """Block until the chips are stable.
+
+        # Arguments
+            delay: `float`<br/>
+                seconds to wait, nothing is done if it is not positive.
+        """
+        if delay > 0:
+            time.sleep(delay)
+
+    def set_fpga_bias(self, bias_obj):
+        """Set FPGA biases.
+
+        # Arguments
+            bias_obj: `dict`<br/>
+                dictionary that contains FPGA biases for the device.
 
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_USB,
-            libcaer.DYNAPSE_CONFIG_USB_EARLY_PACKET_DELAY,
-            bias_obj["usb_early_packet_delay"],
+        # Returns
+            flag: `bool`<br/>
+                True if set successful, False otherwise.
+        """
+        return self.set_config_batch(
+            [
+                (mod_addr, param_addr, bias_obj[key])
+                for key, mod_addr, param_addr in _FPGA_BIAS_CONFIGS
+            ]
         )
 
-    def set_activity_bias(self, bias_obj, chip_id, core_ids=[0, 1, 2, 3]):
+    def set_activity_bias(self, bias_obj, chip_id, core_ids=_ALL_CORE_IDS):
         """Set biases for each chip.
 
         # Arguments
@@ -508,508 +975,85 @@ class DYNAPSE(USBDevice):
                 `DYNAPSE_CONFIG_DYNAPSE_U3`
             core_ids: `list`<br/>
                 list of core ids from 0 to 3, each element is a int,
-                the default is `[0, 1, 2, 3]`<br/>
+                the default is `(0, 1, 2, 3)`<br/>
                 e.g.,<br/>
                     - `[0, 3]`: set core 0 and core 3<br/>
                     - `[2]`: set core 2<br/>
                     - `[]`: do not set core level biases
-        """
-        assert 0 <= chip_id <= 3
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_ID, chip_id
-        )
-
-        for core_id in core_ids:
-            # make sure teh core id is in the range
-            assert 0 <= core_id <= 3
-            core_id = str(core_id)
-            # IF BUF P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_IF_BUF_P"),
-                    bias_obj["c" + core_id + "_if_buf_p_coarse"],
-                    bias_obj["c" + core_id + "_if_buf_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
-
-            # IF RFR N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_IF_RFR_N"),
-                    bias_obj["c" + core_id + "_if_rfr_n_coarse"],
-                    bias_obj["c" + core_id + "_if_rfr_n_fine"],
-                    True,
-                    True,
-                    True,
-                    True,
-                ),
-            )
-
-            # IF NMDA N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_IF_NMDA_N"),
-                    bias_obj["c" + core_id + "_if_nmda_n_coarse"],
-                    bias_obj["c" + core_id + "_if_nmda_n_fine"],
-                    True,
-                    True,
-                    True,
-                    True,
-                ),
-            )
-
-            # IF DC P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_IF_DC_P"),
-                    bias_obj["c" + core_id + "_if_dc_p_coarse"],
-                    bias_obj["c" + core_id + "_if_dc_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
-
-            # IF TAU1 N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_IF_TAU1_N"),
-                    bias_obj["c" + core_id + "_if_tau1_coarse"],
-                    bias_obj["c" + core_id + "_if_tau1_fine"],
-                    False,
-                    True,
-                    True,
-                    True,
-                ),
-            )
 
-            # IF TAU2 N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_IF_TAU2_N"),
-                    bias_obj["c" + core_id + "_if_tau2_coarse"],
-                    bias_obj["c" + core_id + "_if_tau2_fine"],
-                    True,
-                    True,
-                    True,
-                    True,
-                ),
-            )
-
-            # IF THR N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_IF_THR_N"),
-                    bias_obj["c" + core_id + "_if_thr_n_coarse"],
-                    bias_obj["c" + core_id + "_if_thr_n_fine"],
-                    True,
-                    True,
-                    True,
-                    True,
-                ),
-            )
-
-            # IF AHW P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_IF_AHW_P"),
-                    bias_obj["c" + core_id + "_if_ahw_p_coarse"],
-                    bias_obj["c" + core_id + "_if_ahw_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
-
-            # IF AHTAU N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_IF_AHTAU_N"),
-                    bias_obj["c" + core_id + "_if_ahtau_n_coarse"],
-                    bias_obj["c" + core_id + "_if_ahtau_n_fine"],
-                    True,
-                    True,
-                    True,
-                    True,
-                ),
-            )
-
-            # IF AHTHR N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_IF_AHTHR_N"),
-                    bias_obj["c" + core_id + "_if_ahthr_n_coarse"],
-                    bias_obj["c" + core_id + "_if_ahthr_n_fine"],
-                    True,
-                    True,
-                    True,
-                    True,
-                ),
-            )
-
-            # IF CASC N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_IF_CASC_N"),
-                    bias_obj["c" + core_id + "_if_casc_n_coarse"],
-                    bias_obj["c" + core_id + "_if_casc_n_fine"],
-                    True,
-                    True,
-                    True,
-                    True,
-                ),
-            )
-
-            # PULSE PWLK P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_PULSE_PWLK_P"
-                    ),
-                    bias_obj["c" + core_id + "_pulse_pwlk_p_coarse"],
-                    bias_obj["c" + core_id + "_pulse_pwlk_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
-
-            # PS WEIGHT INH S N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer,
-                        "DYNAPSE_CONFIG_BIAS_C" + core_id + "_PS_WEIGHT_INH_S_N",
-                    ),
-                    bias_obj["c" + core_id + "_ps_weight_inh_s_n_coarse"],
-                    bias_obj["c" + core_id + "_ps_weight_inh_s_n_fine"],
-                    True,
-                    True,
-                    True,
-                    True,
-                ),
-            )
-
-            # PS WEIGHT IN F N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer,
-                        "DYNAPSE_CONFIG_BIAS_C" + core_id + "_PS_WEIGHT_INH_F_N",
-                    ),
-                    bias_obj["c" + core_id + "_ps_weight_inh_f_n_coarse"],
-                    bias_obj["c" + core_id + "_ps_weight_inh_f_n_fine"],
-                    True,
-                    True,
-                    True,
-                    True,
-                ),
-            )
-
-            # PS WEIGHT EXC S N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer,
-                        "DYNAPSE_CONFIG_BIAS_C" + core_id + "_PS_WEIGHT_EXC_S_N",
-                    ),
-                    bias_obj["c" + core_id + "_ps_weight_exc_s_n_coarse"],
-                    bias_obj["c" + core_id + "_ps_weight_exc_s_n_fine"],
-                    True,
-                    True,
-                    True,
-                    True,
-                ),
-            )
-
-            # PS WEIGHT EXC F N
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer,
-                        "DYNAPSE_CONFIG_BIAS_C" + core_id + "_PS_WEIGHT_EXC_F_N",
-                    ),
-                    bias_obj["c" + core_id + "_ps_weight_exc_f_n_coarse"],
-                    bias_obj["c" + core_id + "_ps_weight_exc_f_n_fine"],
-                    True,
-                    True,
-                    True,
-                    True,
-                ),
-            )
-
-            # NPDPII TAU S P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_NPDPII_TAU_S_P"
-                    ),
-                    bias_obj["c" + core_id + "_npdpii_tau_s_p_coarse"],
-                    bias_obj["c" + core_id + "_npdpii_tau_s_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
-
-            # NPDPII TAU F P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_NPDPII_TAU_F_P"
-                    ),
-                    bias_obj["c" + core_id + "_npdpii_tau_f_p_coarse"],
-                    bias_obj["c" + core_id + "_npdpii_tau_f_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
-
-            # NPDPII THR S P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_NPDPII_THR_S_P"
-                    ),
-                    bias_obj["c" + core_id + "_npdpii_thr_s_p_coarse"],
-                    bias_obj["c" + core_id + "_npdpii_thr_s_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
-
-            # NPDPII THR F P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_NPDPII_THR_F_P"
-                    ),
-                    bias_obj["c" + core_id + "_npdpii_thr_f_p_coarse"],
-                    bias_obj["c" + core_id + "_npdpii_thr_f_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
+        # Returns
+            flag: `bool`<br/>
+                True if set successful, False otherwise.
+        """
+        # make sure the core ids are in the range
+        assert all(0 <= c <= 3 for c in core_ids), "invalid core_ids=%s" % (core_ids,)
 
-            # NPDPIE TAU S P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_NPDPIE_TAU_S_P"
-                    ),
-                    bias_obj["c" + core_id + "_npdpie_tau_s_p_coarse"],
-                    bias_obj["c" + core_id + "_npdpie_tau_s_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
+        bias_core_ids = sorted(set(core_ids))
+        bias_values = self._get_bias_values(bias_obj, bias_core_ids)
+        return self._write_activity_bias(
+            chip_id, self._pack_activity_bias(bias_values, bias_core_ids), core_ids
+        )
 
-            # NPDPIE TAU F P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_NPDPIE_TAU_F_P"
-                    ),
-                    bias_obj["c" + core_id + "_npdpie_tau_f_p_coarse"],
-                    bias_obj["c" + core_id + "_npdpie_tau_f_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
+    def _pack_activity_bias(self, bias_values, core_ids):
+        """Pack activity biases into chip configuration words.
 
-            # NPDPIE THR S P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_NPDPIE_THR_S_P"
-                    ),
-                    bias_obj["c" + core_id + "_npdpie_thr_s_p_coarse"],
-                    bias_obj["c" + core_id + "_npdpie_thr_s_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
+        # Arguments
+            bias_values: `numpy.ndarray`<br/>
+                activity bias values from `_get_bias_values`.
+            core_ids: `list`<br/>
+                sorted and unique core ids from 0 to 3, the ones the
+                values were read for.
 
-            # NPDPIE THR F P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(
-                        libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_NPDPIE_THR_F_P"
-                    ),
-                    bias_obj["c" + core_id + "_npdpie_thr_f_p_coarse"],
-                    bias_obj["c" + core_id + "_npdpie_thr_f_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
+        # Returns
+            bias_words: `dict`<br/>
+                maps each core id to a `uint32` array of its bias words,
+                the biases for all the cores are stored under `None`.
+        """
+        bias_rows = np.concatenate(
+            (_CORE_BIAS_ROWS[list(core_ids)].reshape(-1, 7), _GLOBAL_BIAS_ROWS)
+        )
+        bias_rows[:, 1:3] = bias_values
 
-            # R2R P
-            self.set_config(
-                libcaer.DYNAPSE_CONFIG_CHIP,
-                libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-                libcaer.set_dynapse_bias(
-                    getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C" + core_id + "_R2R_P"),
-                    bias_obj["c" + core_id + "_r2r_p_coarse"],
-                    bias_obj["c" + core_id + "_r2r_p_fine"],
-                    True,
-                    True,
-                    False,
-                    True,
-                ),
-            )
+        # encode all the biases in one call, repeated configurations with
+        # the same biases reuse the words
+        words = _encode_bias_rows(bias_rows.tobytes())
 
+        num_core_biases = len(_CORE_BIAS_SPECS)
+        bias_words = {
+            core_id: words[idx * num_core_biases : (idx + 1) * num_core_biases]
+            for idx, core_id in enumerate(core_ids)
+        }
         # biases for all the cores
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-            libcaer.set_dynapse_bias(
-                libcaer.DYNAPSE_CONFIG_BIAS_D_BUFFER,
-                bias_obj["d_buffer_coarse"],
-                bias_obj["d_buffer_fine"],
-                True,
-                True,
-                False,
-                True,
-            ),
-        )
-
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-            libcaer.set_dynapse_bias(
-                libcaer.DYNAPSE_CONFIG_BIAS_D_SSP,
-                bias_obj["d_ssp_coarse"],
-                bias_obj["d_ssp_fine"],
-                True,
-                True,
-                False,
-                True,
-            ),
-        )
+        bias_words[None] = words[len(core_ids) * num_core_biases :]
 
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-            libcaer.set_dynapse_bias(
-                libcaer.DYNAPSE_CONFIG_BIAS_D_SSN,
-                bias_obj["d_ssn_coarse"],
-                bias_obj["d_ssn_fine"],
-                True,
-                True,
-                False,
-                True,
-            ),
-        )
+        return bias_words
 
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-            libcaer.set_dynapse_bias(
-                libcaer.DYNAPSE_CONFIG_BIAS_U_BUFFER,
-                bias_obj["u_buffer_coarse"],
-                bias_obj["u_buffer_fine"],
-                True,
-                True,
-                False,
-                True,
-            ),
-        )
+    def _write_activity_bias(self, chip_id, bias_words, core_ids):
+        """Write packed activity biases to a chip.
 
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-            libcaer.set_dynapse_bias(
-                libcaer.DYNAPSE_CONFIG_BIAS_U_SSP,
-                bias_obj["u_ssp_coarse"],
-                bias_obj["u_ssp_fine"],
-                True,
-                True,
-                False,
-                True,
-            ),
-        )
+        # Arguments
+            chip_id: `uint8_t`<br/>
+                one of `DYNAPSE_CONFIG_DYNAPSE_U0` to
+                `DYNAPSE_CONFIG_DYNAPSE_U3`.
+            bias_words: `dict`<br/>
+                packed biases from `_pack_activity_bias`.
+            core_ids: `iterable`<br/>
+                core ids from 0 to 3 to write the core level biases for.
 
-        self.set_config(
-            libcaer.DYNAPSE_CONFIG_CHIP,
-            libcaer.DYNAPSE_CONFIG_CHIP_CONTENT,
-            libcaer.set_dynapse_bias(
-                libcaer.DYNAPSE_CONFIG_BIAS_U_SSN,
-                bias_obj["u_ssn_coarse"],
-                bias_obj["u_ssn_fine"],
-                True,
-                True,
-                False,
-                True,
+        # Returns
+            flag: `bool`<br/>
+                True if set successful, False otherwise.
+        """
+        assert 0 <= chip_id <= 3
+        if self.handle is None:
+            return False
+
+        # select the chip and stream all of its bias words in one call
+        return libcaer.set_dynapse_chip_content(
+            self.handle,
+            chip_id,
+            np.concatenate(
+                [bias_words[core_id] for core_id in core_ids] + [bias_words[None]]
             ),
         )
 
@@ -1039,57 +1083,46 @@ class DYNAPSE(USBDevice):
     def get_fpga_bias(self):
         """Get bias settings from FPGA.
 
+        The values are cached until they are set again through this
+        class, see `invalidate_config_cache`. Biases that fail to be read
+        are None and are not cached.
+
         # Returns
             bias_obj: `dict`
                 dictionary that contains DYNAPSE current bias settings.
         """
-        bias_obj = {}
-        # DYNAPSE_CONFIG_MUX
-        bias_obj["mux_timestamp_reset"] = self.get_config(
-            libcaer.DYNAPSE_CONFIG_MUX, libcaer.DYNAPSE_CONFIG_MUX_TIMESTAMP_RESET
-        )
-        bias_obj["mux_force_chip_bias_enable"] = self.get_config(
-            libcaer.DYNAPSE_CONFIG_MUX,
-            libcaer.DYNAPSE_CONFIG_MUX_FORCE_CHIP_BIAS_ENABLE,
-        )
-        bias_obj["mux_drop_aer_on_transfer_stall"] = self.get_config(
-            libcaer.DYNAPSE_CONFIG_MUX,
-            libcaer.DYNAPSE_CONFIG_MUX_DROP_AER_ON_TRANSFER_STALL,
-        )
+        cache = self._fpga_bias_cache
 
-        # DYNAPSE_CONFIG_AER
-        bias_obj["aer_ack_delay"] = self.get_config(
-            libcaer.DYNAPSE_CONFIG_AER, libcaer.DYNAPSE_CONFIG_AER_ACK_DELAY
-        )
-        bias_obj["aer_ack_extension"] = self.get_config(
-            libcaer.DYNAPSE_CONFIG_AER, libcaer.DYNAPSE_CONFIG_AER_ACK_EXTENSION
-        )
-        bias_obj["aer_wait_on_transfer_stall"] = self.get_config(
-            libcaer.DYNAPSE_CONFIG_AER,
-            libcaer.DYNAPSE_CONFIG_AER_WAIT_ON_TRANSFER_STALL,
-        )
-        bias_obj["aer_external_aer_control"] = self.get_config(
-            libcaer.DYNAPSE_CONFIG_AER, libcaer.DYNAPSE_CONFIG_AER_EXTERNAL_AER_CONTROL
-        )
-
-        # DYNAPSE_CONFIG_CHIP
-        bias_obj["chip_req_delay"] = self.get_config(
-            libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_REQ_DELAY
-        )
-        bias_obj["chip_req_extension"] = self.get_config(
-            libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_REQ_EXTENSION
-        )
+        # read all the uncached biases in one call
+        missing = [
+            (mod_addr, param_addr)
+            for _, mod_addr, param_addr in _FPGA_BIAS_CONFIGS
+            if (mod_addr, param_addr) not in cache
+        ]
+        values = {}
+        if missing:
+            read_values = self.get_config_batch(missing)
+            if read_values is None:
+                read_values = [None] * len(missing)
+            values = dict(zip(missing, read_values))
+            # failed reads are None and not cached, they are read again
+            # by the next call
+            cache.update(
+                (config, value) for config, value in values.items() if value is not None
+            )
 
-        bias_obj["usb_early_packet_delay"] = self.get_config(
-            libcaer.DYNAPSE_CONFIG_USB, libcaer.DYNAPSE_CONFIG_USB_EARLY_PACKET_DELAY
-        )
+        bias_obj = {}
+        for key, mod_addr, param_addr in _FPGA_BIAS_CONFIGS:
+            config = (mod_addr, param_addr)
+            bias_obj[key] = cache[config] if config in cache else values[config]
 
         return bias_obj
 
     def save_fpga_bias_to_json(self, file_path):
         """Save FPGA bias to JSON.
 
-        Only the bias from FPGA can be retrieved.
+        Only the bias from FPGA can be retrieved. The file is not
+        rewritten if it still holds the same biases from the last save.
 
         # Arguments
             file_path: `str`<br/>
@@ -1097,12 +1130,31 @@ class DYNAPSE(USBDevice):
 
         # Returns
             flag: `bool`<br/>
-                returns True if success in writing, False otherwise.
+                returns True if success in writing, False otherwise,
+                e.g., if a bias failed to be read.
         """
         bias_obj = self.get_fpga_bias()
-        return utils.write_json(file_path, bias_obj)
-
-    def start_data_stream(self, send_default_config=True):
+        if None in bias_obj.values():
+            return False
+
+        # skip writing if the same biases are already in the file
+        bias_hash = hash(tuple(sorted(bias_obj.items())))
+        if self._saved_fpga_bias is not None:
+            saved_path, saved_hash, saved_mtime = self._saved_fpga_bias
+            if (
+                saved_path == file_path
+                and saved_hash == bias_hash
+                and os.path.isfile(file_path)
+                and os.path.getmtime(file_path) == saved_mtime
+            ):
+                return True
+
+        flag = utils.write_json(file_path, bias_obj)
+        if flag:
+            self._saved_fpga_bias = (file_path, bias_hash, os.path.getmtime(file_path))
+        return flag
+
+    def start_data_stream(self, send_default_config=True, prefetch=None):
         """Start streaming data.
 
         # Arguments
@@ -1110,11 +1162,17 @@ class DYNAPSE(USBDevice):
                 send default config to the device before starting
                 the data streaming.<br/>
                 `default is True`
+            prefetch: `bool`<br/>
+                fetch packet containers in a background thread,
+                see `start_prefetch`. If None, prefetch as the last
+                data stream did, so that restarts keep the setting.<br/>
+                `default is None`
         """
         if send_default_config is True:
             self.send_default_config()
         self.data_start()
         self.set_data_exchange_blocking()
+        self._restore_prefetch(prefetch)
 
     def core_xy_to_neuron_id(self, core_id, column_x, row_y):
         """Map core ID and column/row address to the correct chip global neuron address.
@@ -1131,9 +1189,35 @@ class DYNAPSE(USBDevice):
             neuron_id: `uint16`<br/>
                 chip global neuron address
         """
-        return libcaer.caerDynapseCoreXYToNeuronId(
-            coreId=core_id, columnX=column_x, rowY=row_y
-        )
+        # plain ints, so numpy scalars do not overflow in the shifts
+        core_id, column_x, row_y = int(core_id), int(column_x), int(row_y)
+        assert 0 <= core_id <= 3 and 0 <= column_x <= 15 and 0 <= row_y <= 15
+
+        return (core_id << 8) | (row_y << 4) | column_x
+
+    def core_xy_to_neuron_id_bulk(self, core_ids, column_xs, row_ys):
+        """Map arrays of core ID and column/row addresses to chip global neuron
+        addresses.
+
+        # Arguments
+            core_ids: `numpy.ndarray`<br/>
+                the chip's core IDs, range [0, 3].
+            column_xs: `numpy.ndarray`<br/>
+                the neurons' column addresses, range [0, 15].
+            row_ys: `numpy.ndarray`<br/>
+                the neurons' row addresses, range [0, 15].
+
+        # Returns
+            neuron_ids: `numpy.ndarray`<br/>
+                chip global neuron addresses in `uint16`.
+
+        A `ValueError` is raised if an address is out of range.
+        """
+        return _CORE_XY_TO_NEURON_ID[
+            _check_address_range(core_ids, 3, "core_ids"),
+            _check_address_range(row_ys, 15, "row_ys"),
+            _check_address_range(column_xs, 15, "column_xs"),
+        ]
 
     def core_id_to_neuron_id(self, core_id, neuron_id_core):
         """Map core ID and per-core neuron address to the correct chip global neuron
@@ -1149,9 +1233,32 @@ class DYNAPSE(USBDevice):
             neuron_id: `uint16`<br/>
                 chip global neuron address.
         """
-        return libcaer.caerDynapseCoreAddrToNeuronId(
-            coreId=core_id, neuronAddrCore=neuron_id_core
-        )
+        # plain ints, so numpy scalars do not overflow in the shifts
+        core_id, neuron_id_core = int(core_id), int(neuron_id_core)
+        assert 0 <= core_id <= 3 and 0 <= neuron_id_core <= 255
+
+        return (core_id << 8) | neuron_id_core
+
+    def core_id_to_neuron_id_bulk(self, core_ids, neuron_ids_core):
+        """Map arrays of core ID and per-core neuron addresses to chip global
+        neuron addresses.
+
+        # Arguments
+            core_ids: `numpy.ndarray`<br/>
+                the chip's core IDs, range [0, 3].
+            neuron_ids_core: `numpy.ndarray`<br/>
+                the neurons' addresses within their cores, range [0, 255].
+
+        # Returns
+            neuron_ids: `numpy.ndarray`<br/>
+                chip global neuron addresses in `uint16`.
+
+        A `ValueError` is raised if an address is out of range.
+        """
+        return _CORE_XY_TO_NEURON_ID.reshape(4, 256)[
+            _check_address_range(core_ids, 3, "core_ids"),
+            _check_address_range(neuron_ids_core, 255, "neuron_ids_core"),
+        ]
 
     def write_poisson_spikerate(self, neuron_id, rate):
         """Specifies the poisson spike generator's spike rate.
@@ -1167,8 +1274,41 @@ class DYNAPSE(USBDevice):
             flag: `bool`<br/>
                 True if success, False otherwise
         """
-        return libcaer.caerDynapseWritePoissonSpikeRate(
-            self.handle, neuronAddr=neuron_id, rateHz=rate
+        self.wait_stable()
+        return libcaer.caerDynapseWritePoissonSpikeRate(self.handle, neuron_id, rate)
+
+    def write_poisson_spikerate_batch(self, neuron_ids, rates):
+        """Specifies the poisson spike generators' spike rates of a batch
+        of neurons.
+
+        Same as calling `write_poisson_spikerate` for each neuron, but all
+        the rates are written within a single call to `libcaer`.
+        The arguments are broadcast against each other, e.g., a single
+        `rates` value can be used for all the neurons.
+
+        # Arguments
+            neuron_ids: `numpy.ndarray`<br/>
+                The target neurons of the poisson spike trains,
+                range [0,1023].
+            rates: `numpy.ndarray`<br/>
+                The rates in Hz of the spike trains, range [0, 4300].
+
+        # Returns
+            flag: `bool`<br/>
+                True if all the rates are written, False otherwise
+
+        A `ValueError` is raised if an argument is out of range.
+        """
+        neuron_ids, rates = np.broadcast_arrays(
+            _check_address_range(neuron_ids, 1023, "neuron_ids"),
+            _check_address_range(rates, 4300, "rates"),
+        )
+        self.wait_stable()
+
+        return libcaer.write_dynapse_poisson_spikerate_multi(
+            self.handle,
+            np.ascontiguousarray(neuron_ids, dtype=np.uint16).reshape(-1),
+            np.ascontiguousarray(rates, dtype=np.float32).reshape(-1),
         )
 
     def write_sram_N(
@@ -1211,16 +1351,70 @@ class DYNAPSE(USBDevice):
             flag: `bool`<br/>
                 True if success, False otherwise
         """
+        self.wait_stable()
         return libcaer.caerDynapseWriteSramN(
-            handle=self.handle,
-            neuronAddr=neuron_id,
-            sramId=sram_id,
-            virtualCoreId=virtual_core_id,
-            sx=sx,
-            dx=dx,
-            sy=sy,
-            dy=dy,
-            destinationCore=destination_core,
+            self.handle,
+            neuron_id,
+            sram_id,
+            virtual_core_id,
+            sx,
+            dx,
+            sy,
+            dy,
+            destination_core,
+        )
+
+    def write_sram_N_batch(
+        self, neuron_ids, sram_ids, virtual_core_ids, sx, dx, sy, dy, destination_cores
+    ):
+        """Write a batch of SRAMs.
+
+        Same as calling `write_sram_N` for each set of arguments, but all
+        the SRAMs are written within a single call to `libcaer`.
+        The arguments are broadcast against each other, e.g., a single
+        `destination_cores` value can be used for all the SRAMs.
+
+        # Arguments
+            neuron_ids: `numpy.ndarray`<br/>
+                the neurons to program, range [0, 1023]
+            sram_ids: `numpy.ndarray`<br/>
+                SRAM addresses, range [0, 3]
+            virtual_core_ids: `numpy.ndarray`<br/>
+                fake source core IDs, range [0, 3].
+            sx: `numpy.ndarray`<br/>
+                X directions, see `write_sram_N`.
+            dx: `numpy.ndarray`<br/>
+                X deltas, range is [0, 3]
+            sy: `numpy.ndarray`<br/>
+                Y directions, see `write_sram_N`.
+            dy: `numpy.ndarray`<br/>
+                Y deltas, range is [0, 3]
+            destination_cores: `numpy.ndarray`<br/>
+                spike destination cores in one-hot coding, see `write_sram_N`.
+
+        # Returns
+            flag: `bool`<br/>
+                True if all the SRAMs are written, False otherwise
+
+        A `ValueError` is raised if an argument is out of range.
+        """
+        srams = np.stack(
+            np.broadcast_arrays(
+                _check_address_range(neuron_ids, 1023, "neuron_ids"),
+                _check_address_range(sram_ids, 3, "sram_ids"),
+                _check_address_range(virtual_core_ids, 3, "virtual_core_ids"),
+                _check_address_range(sx, 1, "sx"),
+                _check_address_range(dx, 3, "dx"),
+                _check_address_range(sy, 1, "sy"),
+                _check_address_range(dy, 3, "dy"),
+                _check_address_range(destination_cores, 15, "destination_cores"),
+            ),
+            axis=-1,
+        )
+        self.wait_stable()
+
+        return libcaer.write_dynapse_sram_multi(
+            self.handle, np.ascontiguousarray(srams, dtype=np.uint16).reshape(-1)
         )
 
     def write_cam(self, input_neuron_id, neuron_id, cam_id, synapse_type):
@@ -1251,17 +1445,64 @@ class DYNAPSE(USBDevice):
             flag: `bool`<br/>
                 True if success, False otherwise
         """
+        self.wait_stable()
         return libcaer.caerDynapseWriteCam(
-            handle=self.handle,
-            inputNeuronAddr=input_neuron_id,
-            neuronAddr=neuron_id,
-            camId=cam_id,
-            synapseType=synapse_type,
+            self.handle, input_neuron_id, neuron_id, cam_id, synapse_type
+        )
+
+    def write_cam_batch(self, input_neuron_ids, neuron_ids, cam_ids, synapse_types):
+        """Write a batch of CAMs.
+
+        Same as calling `write_cam` for each set of arguments, but all
+        the CAMs are written within a single call to `libcaer`.
+        The arguments are broadcast against each other, e.g., a single
+        `synapse_types` value can be used for all the CAMs.
+
+        # Arguments
+            input_neuron_ids: `numpy.ndarray`<br/>
+                the neuron addresses that should be let in as input,
+                range [0, 1023].
+            neuron_ids: `numpy.ndarray`<br/>
+                the neuron addresses whose CAMs should be programmed,
+                range [0,1023].
+            cam_ids: `numpy.ndarray`<br/>
+                CAM addresses (synapses), range [0,63].
+            synapse_types: `numpy.ndarray`<br/>
+                synaptic weights, see `write_cam`.
+
+        # Returns
+            flag: `bool`<br/>
+                True if all the CAMs are written, False otherwise
+
+        A `ValueError` is raised if an argument is out of range.
+        """
+        input_neuron_ids, neuron_ids, cam_ids, synapse_types = np.broadcast_arrays(
+            _check_address_range(input_neuron_ids, 1023, "input_neuron_ids"),
+            _check_address_range(neuron_ids, 1023, "neuron_ids"),
+            _check_address_range(cam_ids, 63, "cam_ids"),
+            _check_address_range(synapse_types, 3, "synapse_types"),
+        )
+        self.wait_stable()
+
+        return libcaer.write_dynapse_cam_multi(
+            self.handle,
+            np.ascontiguousarray(input_neuron_ids, dtype=np.uint16).reshape(-1),
+            np.ascontiguousarray(neuron_ids, dtype=np.uint16).reshape(-1),
+            np.ascontiguousarray(cam_ids, dtype=np.uint8).reshape(-1),
+            np.ascontiguousarray(synapse_types, dtype=np.uint8).reshape(-1),
         )
 
-    def get_event(self):
+    def get_event(self, copy=True):
         """Get Event.
 
+        # Arguments
+            copy: `bool`<br/>
+                if False, the events are written into a buffer that is
+                reused by the next call, and a view of it is returned.
+                This saves an allocation per call for callers that
+                consume the events before reading again.<br/>
+                `default is True`
+
         # Returns
             spike_events: `numpy.ndarray`<br/>
                 a 2-D array that has the shape of (N, 4) where N
@@ -1274,23 +1515,32 @@ class DYNAPSE(USBDevice):
             num_spike_events: `int`<br/>
                 the number of the spike events.
         """
-        packet_container, packet_number = self.get_packet_container()
+        # the data stream is off until a non-blocking set_bias is done
+        self.wait_stable()
+
+        packet_container, _ = self.get_packet_container()
         if packet_container is not None:
-            num_spike_events = 0
-            spike_events = None
-            for packet_id in range(packet_number):
-                packet_header, packet_type = self.get_packet_header(
-                    packet_container, packet_id
-                )
-                if packet_type == libcaer.SPIKE_EVENT:
-                    events, num_events = self.get_spike_event(packet_header)
-                    spike_events = (
-                        np.hstack((spike_events, events))
-                        if spike_events is not None
-                        else events
+            # count and decode the spikes of all the packets in C
+            num_spike_events = libcaer.get_spike_event_number(packet_container)
+
+            if not num_spike_events:
+                spike_events = None
+            elif copy:
+                spike_events = np.empty((num_spike_events, 4), dtype=np.int64)
+            else:
+                capacity = self._spike_buffer.shape[0]
+                if capacity < num_spike_events:
+                    # at least double the capacity so that a growing
+                    # event rate only reallocates a few times
+                    self._spike_buffer = np.empty(
+                        (max(num_spike_events, 2 * capacity), 4), dtype=np.int64
                     )
-                    num_spike_events += num_events
+                spike_events = self._spike_buffer[:num_spike_events]
+
+            if spike_events is not None:
+                libcaer.get_spike_events(packet_container, spike_events.reshape(-1))
             libcaer.caerEventPacketContainerFree(packet_container)
+
             return (spike_events, num_spike_events)
         else:
             return (None, None)
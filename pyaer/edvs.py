@@ -49,6 +49,15 @@ class eDVS(SerialDevice):
         else:
             self.noise_filter = None
 
+        # reusable buffers for get_event(copy=False)
+        self._pol_buffer = None
+        self._special_buffer = None
+        # packet type -> decoder, get_event skips the other packet types
+        self._packet_decoders = {
+            libcaer.POLARITY_EVENT: self._get_current_polarity_event,
+            libcaer.SPECIAL_EVENT: self.get_special_event,
+        }
+
         self.configs_list = [
             ("cas", libcaer.EDVS_CONFIG_BIAS, libcaer.EDVS_CONFIG_BIAS_CAS),
             ("injGnd", libcaer.EDVS_CONFIG_BIAS, libcaer.EDVS_CONFIG_BIAS_INJGND),
@@ -172,8 +181,13 @@ class eDVS(SerialDevice):
             flag: `bool`<br/>
                 True if set successful, False otherwise.
         """
-        for bias_name, module_address, parameter_address in self.configs_list:
-            self.set_config(module_address, parameter_address, bias_obj[bias_name])
+        # write all the biases in one call
+        return self.set_config_batch(
+            [
+                (module_address, parameter_address, bias_obj[bias_name])
+                for bias_name, module_address, parameter_address in self.configs_list
+            ]
+        )
 
     def get_bias(self):
         """Get bias settings.
@@ -182,10 +196,19 @@ class eDVS(SerialDevice):
             bias_obj: `dict`<br/>
                 dictionary that contains eDVS current bias settings.
         """
-        bias_obj = {}
+        # read all the biases in one call
+        values = self.get_config_batch(
+            [
+                (module_address, parameter_address)
+                for _, module_address, parameter_address in self.configs_list
+            ]
+        )
+        if values is None:
+            values = [None] * len(self.configs_list)
 
-        for bias_name, module_address, parameter_address in self.configs_list:
-            bias_obj[bias_name] = self.get_config(module_address, parameter_address)
+        bias_obj = {}
+        for (bias_name, _, _), value in zip(self.configs_list, values):
+            bias_obj[bias_name] = value
 
         return bias_obj
 
@@ -203,17 +226,19 @@ class eDVS(SerialDevice):
         bias_obj = self.get_bias()
         return utils.write_json(file_path, bias_obj)
 
-    def start_data_stream(self):
+    def start_data_stream(self, prefetch=None):
         """Start streaming data.
 
         # Arguments
-            send_default_config: `bool`<br/>
-                send default config to the device before starting
-                the data streaming.<br/>
-                `default is True`
+            prefetch: `bool`<br/>
+                fetch packet containers in a background thread,
+                see `start_prefetch`. If None, prefetch as the last
+                data stream did, so that restarts keep the setting.<br/>
+                `default is None`
         """
         self.data_start()
         self.set_data_exchange_blocking()
+        self._restore_prefetch(prefetch)
 
     def get_polarity_event(self, packet_header, noise_filter=False):
         """Get a packet of polarity event.
@@ -258,9 +283,32 @@ class eDVS(SerialDevice):
 
         return events, num_events
 
-    def get_event(self):
+    def _get_current_polarity_event(self, packet_header):
+        """Get a packet of polarity event with the current noise filter setting.
+
+        # Arguments
+            packet_header: `caerEventPacketHeader`<br/>
+                the header that represents a event packet
+
+        # Returns
+            events: `numpy.ndarray`<br/>
+                the events from `get_polarity_event`.
+            num_events: `int`<br/>
+                number of the polarity events available in the packet.
+        """
+        return self.get_polarity_event(packet_header, self.filter_noise)
+
+    def get_event(self, copy=True):
         """Get event.
 
+        # Arguments
+            copy: `bool`<br/>
+                if False, the events are written into buffers that are
+                reused by the next call, and views of them are returned.
+                This saves the allocations per call for callers that
+                consume the events before reading again.<br/>
+                `default is True`
+
         # Returns
             pol_events: `numpy.ndarray`<br/>
                 a 2-D array that has the shape of (N, 4) where N
@@ -288,32 +336,78 @@ class eDVS(SerialDevice):
         """
         packet_container, packet_number = self.get_packet_container()
         if packet_container is not None:
-            num_pol_event = 0
-            num_special_event = 0
-            pol_events = None
-            special_events = None
+            # collect the packets and stack them once
+            decoders = self._packet_decoders
+            type_packets = {packet_type: [] for packet_type in decoders}
+            num_type_events = dict.fromkeys(decoders, 0)
             for packet_id in range(packet_number):
                 packet_header, packet_type = self.get_packet_header(
                     packet_container, packet_id
                 )
-                if packet_type == libcaer.POLARITY_EVENT:
-                    events, num_events = self.get_polarity_event(packet_header)
-                    pol_events = (
-                        np.hstack((pol_events, events))
-                        if pol_events is not None
-                        else events
-                    )
-                    num_pol_event += num_events
-                elif packet_type == libcaer.SPECIAL_EVENT:
-                    events, num_events = self.get_special_event(packet_header)
-                    special_events = (
-                        np.hstack((special_events, events))
-                        if special_events is not None
-                        else events
-                    )
-                    num_special_event += num_events
+                decoder = decoders.get(packet_type)
+                if decoder is not None:
+                    events, num_events = decoder(packet_header)
+                    type_packets[packet_type].append(events)
+                    num_type_events[packet_type] += num_events
             libcaer.caerEventPacketContainerFree(packet_container)
 
+            pol_packets = type_packets[libcaer.POLARITY_EVENT]
+            special_packets = type_packets[libcaer.SPECIAL_EVENT]
+            num_pol_event = num_type_events[libcaer.POLARITY_EVENT]
+            num_special_event = num_type_events[libcaer.SPECIAL_EVENT]
+
+            if copy:
+                pol_events = (
+                    np.concatenate(pol_packets, axis=0) if pol_packets else None
+                )
+                special_events = (
+                    np.concatenate(special_packets, axis=0) if special_packets else None
+                )
+            else:
+                pol_events = self._stack_into_buffer(
+                    "_pol_buffer", pol_packets, num_pol_event
+                )
+                special_events = self._stack_into_buffer(
+                    "_special_buffer", special_packets, num_special_event
+                )
+
             return (pol_events, num_pol_event, special_events, num_special_event)
         else:
             return None
+
+    def _stack_into_buffer(self, buffer_name, packets, num_events):
+        """Stack event packets into a buffer that is reused across calls.
+
+        # Arguments
+            buffer_name: `str`<br/>
+                attribute name of the buffer.
+            packets: `list`<br/>
+                event arrays of the packets.
+            num_events: `int`<br/>
+                total number of events in the packets.
+
+        # Returns
+            events: `numpy.ndarray`<br/>
+                a view of the buffer that holds the events,
+                None if there is no packet.
+        """
+        if not packets:
+            return None
+
+        buffer = getattr(self, buffer_name)
+        if (
+            buffer is None
+            or buffer.shape[0] < num_events
+            or buffer.shape[1:] != packets[0].shape[1:]
+            or buffer.dtype != packets[0].dtype
+        ):
+            # at least double the capacity so that a growing event rate
+            # only reallocates a few times
+            capacity = 0 if buffer is None else buffer.shape[0]
+            buffer = np.empty(
+                (max(num_events, 2 * capacity),) + packets[0].shape[1:],
+                dtype=packets[0].dtype,
+            )
+            setattr(self, buffer_name, buffer)
+
+        return np.concatenate(packets, axis=0, out=buffer[:num_events])
@@ -41,6 +41,27 @@
 %ignore caerDeviceClose;
 %ignore caerFrameUtilsPixelColor;
 
+/* Let other Python threads run while these calls wait on the device.
+ * pyaer passes no Python callbacks to caerDeviceDataStart, and the batch
+ * helpers below only touch C buffers once their arguments are converted. */
+%define %release_gil(function)
+%exception function {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+}
+%enddef
+
+%release_gil(caerDeviceDataStart)
+%release_gil(caerDeviceDataStop)
+%release_gil(caerDeviceDataGet)
+%release_gil(set_config_batch)
+%release_gil(get_config_batch)
+%release_gil(set_dynapse_chip_content)
+%release_gil(write_dynapse_cam_multi)
+%release_gil(write_dynapse_poisson_spikerate_multi)
+%release_gil(write_dynapse_sram_multi)
+
 %include "stdint.i"
 %include <libcaer/libcaer.h>
 %include <libcaer/network.h>
@@ -243,6 +264,30 @@ bool biasHigh, bool typeNormal, bool sexN, bool enabled) {
 }
 %}
 
+%apply (uint8_t* IN_ARRAY1, int32_t DIM1) {(uint8_t* bias_vec, int32_t bias_len)}
+%apply (uint32_t* ARGOUT_ARRAY1, int32_t DIM1) {(uint32_t* bias_word_vec, int32_t num_biases)}
+
+%inline %{
+void set_dynapse_bias_multi(uint8_t* bias_vec, int32_t bias_len, uint32_t* bias_word_vec, int32_t num_biases) {
+    // each bias takes 7 values: biasAddress, coarseValue, fineValue,
+    // biasHigh, typeNormal, sexN, enabled
+    struct caer_bias_dynapse biasValue;
+
+    long i;
+    for (i=0; i<(long)num_biases && i*7+6<(long)bias_len; i++) {
+        biasValue.biasAddress = bias_vec[i*7];
+        biasValue.coarseValue = bias_vec[i*7+1];
+        biasValue.fineValue = bias_vec[i*7+2];
+        biasValue.biasHigh = bias_vec[i*7+3];
+        biasValue.typeNormal = bias_vec[i*7+4];
+        biasValue.sexN = bias_vec[i*7+5];
+        biasValue.enabled = bias_vec[i*7+6];
+
+        bias_word_vec[i] = caerBiasDynapseGenerate(biasValue);
+    }
+}
+%}
+
 %inline %{
 caerDeviceDiscoveryResult device_discover(int16_t device_type) {
     caerDeviceDiscoveryResult discoveredDevices;
@@ -438,6 +483,49 @@ void get_spike_event(caerSpikeEventPacket event_packet, int64_t* event_vec, int3
 }
 %}
 
+%apply (int64_t* INPLACE_ARRAY1, int32_t DIM1) {(int64_t* spike_vec, int32_t spike_len)}
+
+%inline %{
+int64_t get_spike_event_number(caerEventPacketContainer container) {
+    int32_t num_packets = caerEventPacketContainerGetEventPacketsNumber(container);
+    int64_t num_events = 0;
+    int32_t i;
+    for (i=0; i<num_packets; i++) {
+        caerEventPacketHeader header = caerEventPacketContainerGetEventPacket(container, i);
+        if (header != NULL && caerEventPacketHeaderGetEventType(header) == SPIKE_EVENT) {
+            num_events += caerEventPacketHeaderGetEventNumber(header);
+        }
+    }
+    return num_events;
+}
+%}
+
+%inline %{
+void get_spike_events(caerEventPacketContainer container, int64_t* spike_vec, int32_t spike_len) {
+    /* decode the spike events of all the packets in the container */
+    int32_t num_packets = caerEventPacketContainerGetEventPacketsNumber(container);
+    long offset = 0;
+    int32_t i;
+    for (i=0; i<num_packets; i++) {
+        caerEventPacketHeader header = caerEventPacketContainerGetEventPacket(container, i);
+        if (header == NULL || caerEventPacketHeaderGetEventType(header) != SPIKE_EVENT) {
+            continue;
+        }
+        caerSpikeEventPacket event_packet = (caerSpikeEventPacket) header;
+        int32_t num_events = caerEventPacketHeaderGetEventNumber(header);
+        int32_t j;
+        for (j=0; j<num_events && offset+4<=(long)spike_len; j++) {
+            caerSpikeEvent event = caerSpikeEventPacketGetEvent(event_packet, j);
+            spike_vec[offset] = caerSpikeEventGetTimestamp64(event, event_packet);
+            spike_vec[offset+1] = caerSpikeEventGetNeuronID(event);
+            spike_vec[offset+2] = caerSpikeEventGetSourceCoreID(event);
+            spike_vec[offset+3] = caerSpikeEventGetChipID(event);
+            offset += 4;
+        }
+    }
+}
+%}
+
 %inline %{
 void get_frame_event(caerFrameEventConst event, uint8_t* frame_event_vec, int32_t packet_len) {
     long i;
@@ -591,3 +679,121 @@ int64_t get_num_hot_pixels(caerFilterDVSNoise noiseFilter) {
     return (int64_t)(numHotPixels);
 }
 %}
+
+/*
+Configuration related
+*/
+%apply (uint32_t* IN_ARRAY1, int32_t DIM1) {(uint32_t* param_vec, int32_t param_len)}
+
+%apply (int64_t* IN_ARRAY1, int32_t DIM1) {(int64_t* config_vec, int32_t config_len)}
+
+%inline %{
+bool set_config_batch(caerDeviceHandle handle, int64_t* config_vec, int32_t config_len) {
+    bool flag = true;
+    long i;
+    for (i=0; i+2<(long)config_len; i+=3) {
+        flag = caerDeviceConfigSet(handle, (int8_t)config_vec[i], (uint8_t)config_vec[i+1], (uint32_t)config_vec[i+2]) && flag;
+    }
+    return flag;
+}
+%}
+
+%apply (int64_t* ARGOUT_ARRAY1, int32_t DIM1) {(int64_t* config_value_vec, int32_t num_configs)}
+
+%inline %{
+void get_config_batch(caerDeviceHandle handle, int64_t* config_vec, int32_t config_len, int64_t* config_value_vec, int32_t num_configs) {
+    long i;
+    uint32_t param;
+    for (i=0; i<(long)num_configs && 2*i+1<(long)config_len; i++) {
+        /* failed reads are -1, so that they can be told apart from 0 */
+        if (caerDeviceConfigGet(handle, (int8_t)config_vec[2*i], (uint8_t)config_vec[2*i+1], &param)) {
+            config_value_vec[i] = (int64_t)param;
+        }
+        else {
+            config_value_vec[i] = -1;
+        }
+    }
+    for (; i<(long)num_configs; i++) {
+        config_value_vec[i] = -1;
+    }
+}
+%}
+
+%inline %{
+bool set_dynapse_chip_content(caerDeviceHandle handle, uint8_t chipId, uint32_t* param_vec, int32_t param_len) {
+    if (!caerDeviceConfigSet(handle, DYNAPSE_CONFIG_CHIP, DYNAPSE_CONFIG_CHIP_ID, chipId)) {
+        return false;
+    }
+
+    if (param_len <= 0) {
+        return true;
+    }
+
+    /* all the CHIP_CONTENT words go out in a single USB transfer */
+    return caerDynapseSendDataToUSB(handle, param_vec, (size_t) param_len);
+}
+%}
+
+/*
+DYNAPSE batch writes
+*/
+%apply (uint16_t* IN_ARRAY1, int32_t DIM1) {(uint16_t* input_neuron_vec, int32_t num_input_neurons)}
+%apply (uint16_t* IN_ARRAY1, int32_t DIM1) {(uint16_t* neuron_vec, int32_t num_neurons)}
+%apply (uint8_t* IN_ARRAY1, int32_t DIM1) {(uint8_t* cam_vec, int32_t num_cams)}
+%apply (uint8_t* IN_ARRAY1, int32_t DIM1) {(uint8_t* synapse_type_vec, int32_t num_synapse_types)}
+
+%inline %{
+bool write_dynapse_cam_multi(caerDeviceHandle handle,
+uint16_t* input_neuron_vec, int32_t num_input_neurons,
+uint16_t* neuron_vec, int32_t num_neurons,
+uint8_t* cam_vec, int32_t num_cams,
+uint8_t* synapse_type_vec, int32_t num_synapse_types) {
+    long num_writes = num_input_neurons;
+    if (num_neurons < num_writes) num_writes = num_neurons;
+    if (num_cams < num_writes) num_writes = num_cams;
+    if (num_synapse_types < num_writes) num_writes = num_synapse_types;
+
+    bool flag = true;
+    long i;
+    for (i=0; i<num_writes; i++) {
+        flag = caerDynapseWriteCam(handle, input_neuron_vec[i], neuron_vec[i], cam_vec[i], synapse_type_vec[i]) && flag;
+    }
+    return flag;
+}
+%}
+
+%apply (float* IN_ARRAY1, int32_t DIM1) {(float* rate_vec, int32_t num_rates)}
+
+%inline %{
+bool write_dynapse_poisson_spikerate_multi(caerDeviceHandle handle,
+uint16_t* neuron_vec, int32_t num_neurons,
+float* rate_vec, int32_t num_rates) {
+    long num_writes = num_neurons;
+    if (num_rates < num_writes) num_writes = num_rates;
+
+    bool flag = true;
+    long i;
+    for (i=0; i<num_writes; i++) {
+        flag = caerDynapseWritePoissonSpikeRate(handle, neuron_vec[i], rate_vec[i]) && flag;
+    }
+    return flag;
+}
+%}
+
+%apply (uint16_t* IN_ARRAY1, int32_t DIM1) {(uint16_t* sram_vec, int32_t sram_len)}
+
+%inline %{
+bool write_dynapse_sram_multi(caerDeviceHandle handle, uint16_t* sram_vec, int32_t sram_len) {
+    /* each SRAM takes 8 values: neuronAddr, sramId, virtualCoreId,
+       sx, dx, sy, dy, destinationCore */
+    long num_writes = sram_len / 8;
+
+    bool flag = true;
+    long i;
+    for (i=0; i<num_writes; i++) {
+        uint16_t* sram = sram_vec + i * 8;
+        flag = caerDynapseWriteSramN(handle, sram[0], (uint8_t) sram[1], (uint8_t) sram[2], sram[3] != 0, (uint8_t) sram[4], sram[5] != 0, (uint8_t) sram[6], (uint8_t) sram[7]) && flag;
+    }
+    return flag;
+}
+%}
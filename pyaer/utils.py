@@ -12,6 +12,11 @@ from collections import OrderedDict
 import numpy as np
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import pyaer
 from pyaer import libcaer
 from pyaer import log
@@ -139,7 +144,12 @@ def load_json(file_path):
             A JSON object
     """
     try:
-        json_obj = json.load(open(file_path))
+        with open(file_path, "rb") as f:
+            # orjson parses bytes directly, fall back to json if missing
+            if orjson is not None:
+                json_obj = orjson.loads(f.read())
+            else:
+                json_obj = json.load(f)
         return json_obj
     except IOError:
         return None
@@ -183,7 +193,7 @@ def load_dvs_bias(file_path, verbose=False):
 
     if bias_obj is not None:
         if verbose:
-            for key, value in bias_obj.iteritems():
+            for key, value in bias_obj.items():
                 logger.debug("%s: %d" % (key, value))
         # TODO: to check validity of the bias file
         return bias_obj
@@ -208,7 +218,7 @@ def load_davis_bias(file_path, verbose=False):
 
     if bias_obj is not None:
         if verbose:
-            for key, value in bias_obj.iteritems():
+            for key, value in bias_obj.items():
                 logger.debug("%s: %d" % (key, value))
         # TODO: to check validity of the bias file
         return bias_obj
@@ -231,7 +241,7 @@ def load_dvxplorer_bias(file_path, verbose=False):
 
     if bias_obj is not None:
         if verbose:
-            for key, value in bias_obj.iteritems():
+            for key, value in bias_obj.items():
                 logger.debug("%s: %d" % (key, value))
         # TODO: to check validity of the bias file
         return bias_obj
@@ -254,7 +264,7 @@ def load_evk_bias(file_path, verbose=False):
 
     if bias_obj is not None:
         if verbose:
-            for key, value in bias_obj.iteritems():
+            for key, value in bias_obj.items():
                 logger.debug("%s: %d" % (key, value))
         # TODO: to check validity of the bias file
         return bias_obj
@@ -277,7 +287,7 @@ def load_dynapse_bias(file_path, verbose=False):
 
     if bias_obj is not None:
         if verbose:
-            for key, value in bias_obj.iteritems():
+            for key, value in bias_obj.items():
                 logger.debug("%s: %d" % (key, value))
         # TODO: to check validity of the bias file
         return bias_obj
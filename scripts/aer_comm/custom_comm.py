@@ -4,8 +4,6 @@ Author: Yuhuang Hu
 Email : yuhuang.hu@ini.uzh.ch
 """
 
-from __future__ import print_function, absolute_import
-
 import time
 import cv2
 
@@ -4,8 +4,6 @@ Author: Yuhuang Hu
 Email : yuhuang.hu@ini.uzh.ch
 """
 
-from __future__ import print_function, absolute_import
-
 import os
 from contextlib import suppress
 from pyaer.comm import AERHDF5Reader
@@ -3,8 +3,6 @@
 Author: Yuhuang Hu
 Email : duguyue100@gmail.com
 """
-from __future__ import print_function
-
 import numpy as np
 import cv2
 
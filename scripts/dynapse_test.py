@@ -3,8 +3,6 @@
 Author: Yuhuang Hu
 Email : duguyue100@gmail.com
 """
-from __future__ import print_function
-
 from pyaer.dynapse import DYNAPSE
 from pyaer import utils
 
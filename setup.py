@@ -3,9 +3,6 @@
 Author: Yuhuang Hu
 Email : duguyue100@gmail.com
 """
-from __future__ import absolute_import
-from __future__ import print_function
-
 import os
 from sys import platform
 from sysconfig import get_paths
@@ -83,7 +80,10 @@ setup(
     author=about["__author__"],
     author_email=about["__author_email__"],
     url=about["__url__"],
+    python_requires=">=3.8",
     install_requires=["numpy"],
+    # faster parsing of bias files, utils.load_json falls back to json
+    extras_require={"orjson": ["orjson"]},
     packages=find_packages(),
     ext_modules=[libcaer_wrap],
     scripts=[
@@ -0,0 +1,187 @@
+"""Test fixtures.
+
+The tests run without libcaer or a device: `pyaer.libcaer_wrap` is replaced
+by `FakeLibcaer` before `pyaer` is imported.
+
+Author: Yuhuang Hu
+Email : duguyue100@gmail.com
+"""
+import itertools
+import sys
+import types
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+
+class FakeLibcaer(types.ModuleType):
+    """Stand-in for the SWIG generated `libcaer_wrap` module.
+
+    Upper case names are distinct integer constants. Any other name is a
+    function that records its call and returns True, tests replace the
+    functions whose results matter with `monkeypatch`. The `pyflags.i`
+    helpers that loop over `libcaer` in C are modelled in Python, so that
+    the recorded calls are the ones made by the helpers.
+    """
+
+    def __init__(self):
+        super(FakeLibcaer, self).__init__("pyaer.libcaer_wrap")
+        self.calls = []
+        # the chip ids are checked to be in [0, 3]
+        self._constants = {"DYNAPSE_CONFIG_DYNAPSE_U%d" % i: i for i in range(4)}
+        self._next_constant = itertools.count(4)
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name.isupper():
+            if name not in self._constants:
+                self._constants[name] = next(self._next_constant)
+            return self._constants[name]
+
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return True
+
+        record.__name__ = name
+        return record
+
+    def caerDynapseInfoGet(self, handle):
+        return SimpleNamespace(
+            deviceID=1,
+            deviceSerialNumber="00000001",
+            deviceUSBBusNumber=1,
+            deviceUSBDeviceAddress=2,
+            deviceString="DYNAPSE",
+            logicVersion=1,
+            deviceIsMaster=True,
+            logicClock=30,
+            chipID=1,
+            aerHasStatistics=False,
+            muxHasStatistics=False,
+        )
+
+    def set_config_batch(self, handle, config_vec):
+        """`caerDeviceConfigSet` for each config, like the `pyflags.i` helper."""
+        flag = True
+        for mod_addr, param_addr, param in config_vec.reshape(-1, 3).tolist():
+            flag = (
+                self.caerDeviceConfigSet(handle, mod_addr, param_addr, param) and flag
+            )
+        return flag
+
+    def get_config_batch(self, handle, config_vec, num_configs):
+        """`caerDeviceConfigGet` for each config, like the `pyflags.i` helper."""
+        values = []
+        for mod_addr, param_addr in config_vec.reshape(-1, 2)[:num_configs].tolist():
+            value = self.caerDeviceConfigGet(handle, mod_addr, param_addr)
+            # failed reads are -1
+            values.append(-1 if value is None else value)
+        return np.array(values, dtype=np.int64)
+
+    def set_dynapse_bias(
+        self,
+        bias_address,
+        coarse_value,
+        fine_value,
+        bias_high,
+        type_normal,
+        sex_n,
+        enabled,
+    ):
+        """A distinct word per bias, the arguments are cut to their C types."""
+        return (
+            (bias_address & 0xFF) << 24
+            | (coarse_value & 0xFF) << 16
+            | (fine_value & 0xFF) << 8
+            | bool(bias_high) << 3
+            | bool(type_normal) << 2
+            | bool(sex_n) << 1
+            | bool(enabled)
+        )
+
+    def set_dynapse_bias_multi(self, bias_vec, num_biases):
+        """`set_dynapse_bias` for each row, like the `pyflags.i` helper."""
+        return np.array(
+            [
+                self.set_dynapse_bias(*row)
+                for row in bias_vec.reshape(-1, 7)[:num_biases].tolist()
+            ],
+            dtype=np.uint32,
+        )
+
+    def set_dynapse_chip_content(self, handle, chip_id, param_vec):
+        """Select the chip and send the words, like the `pyflags.i` helper."""
+        if not self.caerDeviceConfigSet(
+            handle, self.DYNAPSE_CONFIG_CHIP, self.DYNAPSE_CONFIG_CHIP_ID, chip_id
+        ):
+            return False
+        if len(param_vec) <= 0:
+            return True
+        return self.caerDynapseSendDataToUSB(handle, param_vec.tolist(), len(param_vec))
+
+    def write_dynapse_cam_multi(
+        self, handle, input_neuron_vec, neuron_vec, cam_vec, synapse_type_vec
+    ):
+        """`caerDynapseWriteCam` for each CAM, like the `pyflags.i` helper."""
+        flag = True
+        for cam in zip(
+            input_neuron_vec.tolist(),
+            neuron_vec.tolist(),
+            cam_vec.tolist(),
+            synapse_type_vec.tolist(),
+        ):
+            flag = self.caerDynapseWriteCam(handle, *cam) and flag
+        return flag
+
+    def write_dynapse_sram_multi(self, handle, sram_vec):
+        """`caerDynapseWriteSramN` for each SRAM, like the `pyflags.i` helper."""
+        flag = True
+        for sram in sram_vec.reshape(-1, 8).tolist():
+            flag = (
+                self.caerDynapseWriteSramN(
+                    handle,
+                    sram[0],
+                    sram[1],
+                    sram[2],
+                    sram[3] != 0,
+                    sram[4],
+                    sram[5] != 0,
+                    sram[6],
+                    sram[7],
+                )
+                and flag
+            )
+        return flag
+
+    def write_dynapse_poisson_spikerate_multi(self, handle, neuron_vec, rate_vec):
+        """`caerDynapseWritePoissonSpikeRate` per neuron, like `pyflags.i`."""
+        flag = True
+        for neuron_id, rate in zip(neuron_vec.tolist(), rate_vec.tolist()):
+            flag = (
+                self.caerDynapseWritePoissonSpikeRate(handle, neuron_id, rate) and flag
+            )
+        return flag
+
+    def caerEDVSInfoGet(self, handle):
+        return SimpleNamespace(
+            deviceID=1,
+            deviceString="eDVS",
+            deviceIsMaster=True,
+            dvsSizeX=128,
+            dvsSizeY=128,
+            serialPortName="/dev/ttyUSB0",
+            serialBaudRate=12000000,
+        )
+
+
+FAKE_LIBCAER = FakeLibcaer()
+sys.modules["pyaer.libcaer_wrap"] = FAKE_LIBCAER
+
+
+@pytest.fixture
+def libcaer():
+    """The fake `libcaer` module with an empty call record."""
+    del FAKE_LIBCAER.calls[:]
+    return FAKE_LIBCAER
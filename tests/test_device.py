@@ -0,0 +1,204 @@
+"""Tests for the background packet container prefetching.
+
+Author: Yuhuang Hu
+Email : duguyue100@gmail.com
+"""
+import itertools
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from pyaer import device
+from pyaer.davis import DAVIS
+from pyaer.dvs128 import DVS128
+from pyaer.dvxplorer import DVXPLORER
+from pyaer.dynapse import DYNAPSE
+from pyaer.evk import EVK
+
+
+@pytest.fixture
+def usb_device():
+    usb_device = device.USBDevice()
+    usb_device.handle = 1
+    yield usb_device
+    usb_device.data_stop()
+
+
+def fake_stream(monkeypatch, libcaer, has_data=True):
+    """Let `caerDeviceDataGet` produce numbered containers.
+
+    # Returns
+        stream: `dict`<br/>
+            `produced` and `freed` containers, and the number of
+            `late_reads` from a stopped stream.
+    """
+    stream = {"produced": [], "freed": [], "stopped": False, "late_reads": 0}
+    numbers = itertools.count(1)
+
+    def data_get(handle):
+        if stream["stopped"]:
+            stream["late_reads"] += 1
+        time.sleep(0.001)
+        if not has_data:
+            return None
+        stream["produced"].append(next(numbers))
+        return stream["produced"][-1]
+
+    monkeypatch.setattr(libcaer, "caerDeviceDataGet", data_get)
+    monkeypatch.setattr(
+        libcaer,
+        "caerDeviceDataStart",
+        lambda handle, *callbacks: stream.update(stopped=False) or True,
+    )
+    monkeypatch.setattr(
+        libcaer, "caerDeviceDataStop", lambda handle: stream.update(stopped=True)
+    )
+    monkeypatch.setattr(libcaer, "caerEventPacketContainerFree", stream["freed"].append)
+    monkeypatch.setattr(
+        libcaer, "caerEventPacketContainerGetEventPacketsNumber", lambda c: 1
+    )
+    return stream
+
+
+def test_prefetch_keeps_container_order(libcaer, monkeypatch, usb_device):
+    fake_stream(monkeypatch, libcaer)
+    usb_device.start_prefetch()
+
+    containers = [usb_device.get_packet_container()[0] for _ in range(10)]
+
+    assert containers == list(range(1, 11))
+
+
+def test_data_stop_joins_prefetch_thread_first(libcaer, monkeypatch, usb_device):
+    stream = fake_stream(monkeypatch, libcaer)
+    usb_device.start_prefetch(max_containers=3)
+    thread = usb_device._prefetch_thread
+    read = [usb_device.get_packet_container()[0] for _ in range(5)]
+    # let the thread fill the queue
+    time.sleep(0.05)
+
+    alive_at_stop = []
+    monkeypatch.setattr(
+        libcaer,
+        "caerDeviceDataStop",
+        lambda handle: alive_at_stop.append(thread.is_alive()),
+    )
+    usb_device.data_stop()
+
+    assert alive_at_stop == [False]
+    assert stream["late_reads"] == 0
+    assert usb_device._prefetch_thread is None
+    # every container was either read or freed
+    assert sorted(read + stream["freed"]) == stream["produced"]
+
+
+def test_data_stop_wakes_waiting_reader(libcaer, monkeypatch, usb_device):
+    fake_stream(monkeypatch, libcaer, has_data=False)
+    usb_device.start_prefetch()
+
+    results = []
+    reader = threading.Thread(
+        target=lambda: results.append(usb_device.get_packet_container())
+    )
+    reader.start()
+    time.sleep(0.02)
+    usb_device.data_stop()
+    reader.join(timeout=1)
+
+    assert not reader.is_alive()
+    assert results == [(None, None)]
+
+
+@pytest.mark.parametrize("was_blocking", [True, False])
+def test_prefetch_polls_and_restores_blocking(
+    libcaer, monkeypatch, usb_device, was_blocking
+):
+    fake_stream(monkeypatch, libcaer, has_data=False)
+    blocking = []
+    monkeypatch.setattr(usb_device, "set_data_exchange_blocking", blocking.append)
+    monkeypatch.setattr(
+        usb_device, "get_config", lambda mod_addr, param_addr: was_blocking
+    )
+
+    usb_device.start_prefetch()
+    usb_device.data_stop()
+
+    assert blocking == [False, was_blocking]
+
+
+def test_reader_returns_when_prefetch_thread_dies(libcaer, monkeypatch, usb_device):
+    fake_stream(monkeypatch, libcaer, has_data=False)
+    monkeypatch.setattr(usb_device, "_prefetch_packet_containers", lambda: None)
+    usb_device.start_prefetch()
+    usb_device._prefetch_thread.join()
+
+    assert usb_device.get_packet_container() == (None, None)
+
+
+def test_restart_keeps_prefetch_setting(libcaer, monkeypatch):
+    stream = fake_stream(monkeypatch, libcaer)
+    dynapse = DYNAPSE()
+
+    dynapse.start_data_stream(send_default_config=False, prefetch=True)
+    dynapse.start_prefetch(max_containers=4)
+    assert dynapse._prefetch_thread is not None
+
+    # bias changes restart the stream like this
+    dynapse.data_stop()
+    dynapse._stable_at = time.monotonic()
+    dynapse.wait_stable()
+    assert dynapse._prefetch_thread is not None
+    assert dynapse._prefetch_queue.maxsize == 4
+
+    dynapse.data_stop()
+    dynapse.start_data_stream(send_default_config=False, prefetch=False)
+    assert dynapse._prefetch_thread is None
+
+    dynapse.data_stop()
+    dynapse.start_data_stream(send_default_config=False)
+    assert dynapse._prefetch_thread is None
+
+    dynapse.data_stop()
+    assert stream["late_reads"] == 0
+
+
+@pytest.mark.parametrize("device_class", [DAVIS, DVS128, DVXPLORER, EVK])
+def test_start_data_stream_restores_prefetch(libcaer, monkeypatch, device_class):
+    stream = fake_stream(monkeypatch, libcaer)
+    # the device info is not needed to stream
+    usb_device = device_class.__new__(device_class)
+    device.USBDevice.__init__(usb_device)
+    usb_device.handle = 1
+
+    usb_device.start_data_stream(send_default_config=False, prefetch=True)
+    usb_device.start_prefetch(max_containers=4)
+    usb_device.data_stop()
+    usb_device.start_data_stream(send_default_config=False)
+    assert usb_device._prefetch_thread is not None
+    assert usb_device._prefetch_queue.maxsize == 4
+
+    usb_device.data_stop()
+    usb_device.start_data_stream(send_default_config=False, prefetch=False)
+    assert usb_device._prefetch_thread is None
+
+    usb_device.data_stop()
+    assert stream["late_reads"] == 0
+
+
+def test_get_spike_event(libcaer, monkeypatch):
+    monkeypatch.setattr(libcaer, "caerEventPacketHeaderGetEventNumber", lambda h: 2)
+    monkeypatch.setattr(
+        libcaer, "caerSpikeEventPacketFromPacketHeader", lambda h: ("spikes", h)
+    )
+    monkeypatch.setattr(
+        libcaer,
+        "get_spike_event",
+        lambda spike, packet_len: np.arange(packet_len) if spike[1] == 7 else None,
+    )
+
+    events, num_events = device.USBDevice().get_spike_event(7)
+
+    assert num_events == 2
+    assert events.tolist() == [[0, 1, 2, 3], [4, 5, 6, 7]]
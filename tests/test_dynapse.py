@@ -0,0 +1,742 @@
+"""Tests for DYNAPSE.
+
+Author: Yuhuang Hu
+Email : duguyue100@gmail.com
+"""
+import itertools
+import os
+
+import numpy as np
+import pytest
+
+from pyaer import dynapse as dynapse_module
+from pyaer import utils
+from pyaer.dynapse import DYNAPSE
+
+
+@pytest.fixture
+def dynapse(libcaer):
+    dynapse = DYNAPSE()
+    # record only the calls of the test
+    del libcaer.calls[:]
+    return dynapse
+
+
+@pytest.fixture
+def config_reads(libcaer, monkeypatch):
+    """Fake `get_config_batch` that fails the reads listed in `failing`.
+
+    # Returns
+        config_reads: `dict`<br/>
+            `failing` is a set of (mod_addr, param_addr) pairs to fail,
+            `values` maps pairs to the values read instead of 100,
+            `requests` records the pairs of each call.
+    """
+    config_reads = {"failing": set(), "values": {}, "requests": []}
+
+    def get_config_batch(handle, config_vec, num_configs):
+        configs = [tuple(config) for config in config_vec.reshape(-1, 2).tolist()]
+        config_reads["requests"].append(configs)
+        return np.array(
+            [
+                (
+                    -1
+                    if config in config_reads["failing"]
+                    else config_reads["values"].get(config, 100)
+                )
+                for config in configs
+            ],
+            dtype=np.int64,
+        )
+
+    monkeypatch.setattr(libcaer, "get_config_batch", get_config_batch)
+    return config_reads
+
+
+def fpga_config(index):
+    """(key, mod_addr, param_addr) of an FPGA bias."""
+    return dynapse_module._FPGA_BIAS_CONFIGS[index]
+
+
+def test_get_fpga_bias_caches_reads(dynapse, config_reads):
+    first = dynapse.get_fpga_bias()
+    second = dynapse.get_fpga_bias()
+
+    assert first == second
+    assert set(first.values()) == {100}
+    assert len(config_reads["requests"]) == 1
+
+
+def test_get_fpga_bias_does_not_cache_failed_reads(dynapse, config_reads):
+    key, mod_addr, param_addr = fpga_config(0)
+    config_reads["failing"].add((mod_addr, param_addr))
+
+    assert dynapse.get_fpga_bias()[key] is None
+
+    # only the failed bias is read again
+    config_reads["failing"].clear()
+    assert dynapse.get_fpga_bias()[key] == 100
+    assert config_reads["requests"][-1] == [(mod_addr, param_addr)]
+
+
+def test_get_fpga_bias_without_handle_is_not_cached(dynapse, config_reads):
+    dynapse.handle = None
+    assert set(dynapse.get_fpga_bias().values()) == {None}
+
+    dynapse.handle = 1
+    assert set(dynapse.get_fpga_bias().values()) == {100}
+
+
+def test_set_config_invalidates_cached_read(dynapse, config_reads):
+    dynapse.get_fpga_bias()
+    _, mod_addr, param_addr = fpga_config(1)
+
+    dynapse.set_config(mod_addr, param_addr, 5)
+    dynapse.get_fpga_bias()
+    assert config_reads["requests"][-1] == [(mod_addr, param_addr)]
+
+    dynapse.set_config_batch([(mod_addr, param_addr, 6)])
+    dynapse.get_fpga_bias()
+    assert config_reads["requests"][-1] == [(mod_addr, param_addr)]
+
+    dynapse.invalidate_config_cache()
+    dynapse.get_fpga_bias()
+    assert len(config_reads["requests"][-1]) == len(dynapse_module._FPGA_BIAS_CONFIGS)
+
+
+def test_save_fpga_bias_refuses_failed_reads(dynapse, config_reads, tmp_path):
+    _, mod_addr, param_addr = fpga_config(0)
+    config_reads["failing"].add((mod_addr, param_addr))
+    file_path = str(tmp_path / "fpga_bias.json")
+
+    assert dynapse.save_fpga_bias_to_json(file_path) is False
+    assert not (tmp_path / "fpga_bias.json").exists()
+
+
+@pytest.fixture
+def json_writes(monkeypatch):
+    """Record the paths written by `utils.write_json`."""
+    json_writes = []
+    write_json = utils.write_json
+
+    def record_write(file_path, json_obj):
+        json_writes.append(file_path)
+        return write_json(file_path, json_obj)
+
+    monkeypatch.setattr(utils, "write_json", record_write)
+    return json_writes
+
+
+def test_save_fpga_bias_skips_unchanged_file(
+    dynapse, config_reads, json_writes, tmp_path
+):
+    file_path = str(tmp_path / "fpga_bias.json")
+
+    assert dynapse.save_fpga_bias_to_json(file_path) is True
+    mtime = os.path.getmtime(file_path)
+
+    assert dynapse.save_fpga_bias_to_json(file_path) is True
+    assert json_writes == [file_path]
+    assert os.path.getmtime(file_path) == mtime
+
+    # other biases are written
+    _, mod_addr, param_addr = fpga_config(0)
+    config_reads["values"][(mod_addr, param_addr)] = 5
+    dynapse.set_config(mod_addr, param_addr, 5)
+    assert dynapse.save_fpga_bias_to_json(file_path) is True
+    assert json_writes == [file_path] * 2
+    assert utils.load_json(file_path)[fpga_config(0)[0]] == 5
+
+
+def test_save_fpga_bias_rewrites_edited_file(
+    dynapse, config_reads, json_writes, tmp_path
+):
+    file_path = str(tmp_path / "fpga_bias.json")
+    dynapse.save_fpga_bias_to_json(file_path)
+    with open(file_path) as f:
+        content = f.read()
+
+    with open(file_path, "w") as f:
+        f.write("{}")
+    os.utime(file_path, (0, 0))
+
+    assert dynapse.save_fpga_bias_to_json(file_path) is True
+    assert json_writes == [file_path] * 2
+    with open(file_path) as f:
+        assert f.read() == content
+
+    # a removed file is written again
+    os.remove(file_path)
+    assert dynapse.save_fpga_bias_to_json(file_path) is True
+    assert json_writes == [file_path] * 3
+
+
+def test_core_xy_to_neuron_id_bulk_matches_scalar(dynapse):
+    core_ids, row_ys, column_xs = np.array(
+        list(itertools.product(range(4), range(16), range(16)))
+    ).T
+
+    neuron_ids = dynapse.core_xy_to_neuron_id_bulk(core_ids, column_xs, row_ys)
+
+    assert neuron_ids.tolist() == [
+        dynapse.core_xy_to_neuron_id(core_id, column_x, row_y)
+        for core_id, column_x, row_y in zip(core_ids, column_xs, row_ys)
+    ]
+
+
+def test_core_id_to_neuron_id_bulk_matches_scalar(dynapse):
+    core_ids, neuron_ids_core = np.array(
+        list(itertools.product(range(4), range(256)))
+    ).T
+
+    neuron_ids = dynapse.core_id_to_neuron_id_bulk(core_ids, neuron_ids_core)
+
+    assert neuron_ids.tolist() == [
+        dynapse.core_id_to_neuron_id(core_id, neuron_id_core)
+        for core_id, neuron_id_core in zip(core_ids, neuron_ids_core)
+    ]
+
+
+@pytest.mark.parametrize(
+    "core_ids, column_xs, row_ys",
+    [([-1], [0], [0]), ([4], [0], [0]), ([0], [16], [0]), ([0], [0], [-1])],
+)
+def test_core_xy_to_neuron_id_bulk_rejects_out_of_range(
+    dynapse, core_ids, column_xs, row_ys
+):
+    with pytest.raises(ValueError):
+        dynapse.core_xy_to_neuron_id_bulk(core_ids, column_xs, row_ys)
+
+
+@pytest.mark.parametrize(
+    "core_ids, neuron_ids_core", [([-1], [0]), ([0], [256]), ([0], [-1])]
+)
+def test_core_id_to_neuron_id_bulk_rejects_out_of_range(
+    dynapse, core_ids, neuron_ids_core
+):
+    with pytest.raises(ValueError):
+        dynapse.core_id_to_neuron_id_bulk(core_ids, neuron_ids_core)
+
+
+@pytest.fixture
+def spike_stream(libcaer, monkeypatch):
+    """Fake containers whose spike events count up from `first`.
+
+    # Returns
+        spike_stream: `dict`<br/>
+            set `num_events` before each `get_event` call.
+    """
+    spike_stream = {"num_events": 0, "first": 0}
+
+    def get_spike_events(packet_container, spike_vec):
+        spike_vec[:] = np.arange(spike_vec.size) + spike_stream["first"]
+
+    monkeypatch.setattr(libcaer, "caerDeviceDataGet", lambda handle: object())
+    monkeypatch.setattr(
+        libcaer, "caerEventPacketContainerGetEventPacketsNumber", lambda c: 1
+    )
+    monkeypatch.setattr(
+        libcaer, "get_spike_event_number", lambda c: spike_stream["num_events"]
+    )
+    monkeypatch.setattr(libcaer, "get_spike_events", get_spike_events)
+    return spike_stream
+
+
+def test_get_event_copy_returns_fresh_arrays(dynapse, spike_stream):
+    spike_stream["num_events"] = 3
+    events, num_events = dynapse.get_event()
+
+    assert num_events == 3
+    assert events.shape == (3, 4)
+    assert events.ravel().tolist() == list(range(12))
+    assert not np.shares_memory(events, dynapse._spike_buffer)
+
+
+def test_get_event_without_copy_reuses_buffer(dynapse, spike_stream):
+    spike_stream["num_events"] = 3
+    first, _ = dynapse.get_event(copy=False)
+    assert dynapse._spike_buffer.shape == (3, 4)
+
+    # growing at least doubles the capacity
+    spike_stream["num_events"] = 4
+    dynapse.get_event(copy=False)
+    assert dynapse._spike_buffer.shape == (6, 4)
+    buffer = dynapse._spike_buffer
+
+    # fewer events fit in the same buffer, and overwrite the last result
+    spike_stream["num_events"] = 5
+    second, _ = dynapse.get_event(copy=False)
+    spike_stream["num_events"], spike_stream["first"] = 2, 100
+    third, num_events = dynapse.get_event(copy=False)
+
+    assert dynapse._spike_buffer is buffer
+    assert num_events == 2 and third.shape == (2, 4)
+    assert np.shares_memory(second, third)
+    assert second[:2].tolist() == third.tolist()
+    assert not np.shares_memory(first, third)
+
+
+def test_get_event_without_events(dynapse, spike_stream):
+    spike_stream["num_events"] = 0
+    assert dynapse.get_event(copy=False) == (None, 0)
+
+
+def test_bias_values_out_of_range_are_rejected(dynapse):
+    bias_obj = dict.fromkeys(
+        dynapse_module._GLOBAL_BIAS_KEYS.union(*dynapse_module._CORE_BIAS_KEYS), 1
+    )
+    assert dynapse._get_bias_values(bias_obj, [0]).shape == (
+        len(dynapse_module._CORE_BIAS_SPECS) + len(dynapse_module._GLOBAL_BIAS_SPECS),
+        2,
+    )
+
+    for key, value in [("c0_if_dc_p_fine", 256), ("c0_if_dc_p_coarse", 8)]:
+        with pytest.raises(ValueError, match=key):
+            dynapse.set_activity_bias(dict(bias_obj, **{key: value}), 0, [0])
+
+
+# per-bias writes of the original set_activity_bias, each entry is
+# (address suffix, key stem, biasHigh, typeNormal, sexN, enabled)
+BASELINE_CORE_BIASES = [
+    ("IF_BUF_P", "if_buf_p", True, True, False, True),
+    ("IF_RFR_N", "if_rfr_n", True, True, True, True),
+    ("IF_NMDA_N", "if_nmda_n", True, True, True, True),
+    ("IF_DC_P", "if_dc_p", True, True, False, True),
+    ("IF_TAU1_N", "if_tau1", False, True, True, True),
+    ("IF_TAU2_N", "if_tau2", True, True, True, True),
+    ("IF_THR_N", "if_thr_n", True, True, True, True),
+    ("IF_AHW_P", "if_ahw_p", True, True, False, True),
+    ("IF_AHTAU_N", "if_ahtau_n", True, True, True, True),
+    ("IF_AHTHR_N", "if_ahthr_n", True, True, True, True),
+    ("IF_CASC_N", "if_casc_n", True, True, True, True),
+    ("PULSE_PWLK_P", "pulse_pwlk_p", True, True, False, True),
+    ("PS_WEIGHT_INH_S_N", "ps_weight_inh_s_n", True, True, True, True),
+    ("PS_WEIGHT_INH_F_N", "ps_weight_inh_f_n", True, True, True, True),
+    ("PS_WEIGHT_EXC_S_N", "ps_weight_exc_s_n", True, True, True, True),
+    ("PS_WEIGHT_EXC_F_N", "ps_weight_exc_f_n", True, True, True, True),
+    ("NPDPII_TAU_S_P", "npdpii_tau_s_p", True, True, False, True),
+    ("NPDPII_TAU_F_P", "npdpii_tau_f_p", True, True, False, True),
+    ("NPDPII_THR_S_P", "npdpii_thr_s_p", True, True, False, True),
+    ("NPDPII_THR_F_P", "npdpii_thr_f_p", True, True, False, True),
+    ("NPDPIE_TAU_S_P", "npdpie_tau_s_p", True, True, False, True),
+    ("NPDPIE_TAU_F_P", "npdpie_tau_f_p", True, True, False, True),
+    ("NPDPIE_THR_S_P", "npdpie_thr_s_p", True, True, False, True),
+    ("NPDPIE_THR_F_P", "npdpie_thr_f_p", True, True, False, True),
+    ("R2R_P", "r2r_p", True, True, False, True),
+]
+BASELINE_GLOBAL_BIASES = [
+    ("D_BUFFER", "d_buffer", True, True, False, True),
+    ("D_SSP", "d_ssp", True, True, False, True),
+    ("D_SSN", "d_ssn", True, True, False, True),
+    ("U_BUFFER", "u_buffer", True, True, False, True),
+    ("U_SSP", "u_ssp", True, True, False, True),
+    ("U_SSN", "u_ssn", True, True, False, True),
+]
+
+
+@pytest.fixture
+def bias_obj():
+    """A complete bias dictionary with distinct values."""
+    rng = np.random.RandomState(0)
+    keys = [
+        "c%d_%s" % (core_id, spec[1])
+        for core_id in range(4)
+        for spec in BASELINE_CORE_BIASES
+    ] + [spec[1] for spec in BASELINE_GLOBAL_BIASES]
+
+    bias_obj = {}
+    for key in keys:
+        bias_obj[key + "_coarse"] = int(rng.randint(0, 8))
+        bias_obj[key + "_fine"] = int(rng.randint(0, 256))
+    for key, _, _ in dynapse_module._FPGA_BIAS_CONFIGS:
+        bias_obj[key] = int(rng.randint(0, 100))
+    return bias_obj
+
+
+def baseline_activity_bias_writes(libcaer, bias_obj, chip_id, core_ids):
+    """(mod_addr, param_addr, param) writes of the original set_activity_bias."""
+    biases = [
+        (
+            getattr(libcaer, "DYNAPSE_CONFIG_BIAS_C%d_%s" % (core_id, spec[0])),
+            "c%d_%s" % (core_id, spec[1]),
+            spec[2:],
+        )
+        for core_id in core_ids
+        for spec in BASELINE_CORE_BIASES
+    ] + [
+        (getattr(libcaer, "DYNAPSE_CONFIG_BIAS_" + spec[0]), spec[1], spec[2:])
+        for spec in BASELINE_GLOBAL_BIASES
+    ]
+
+    writes = [(libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_ID, chip_id)]
+    for bias_address, key, flags in biases:
+        word = libcaer.set_dynapse_bias(
+            bias_address, bias_obj[key + "_coarse"], bias_obj[key + "_fine"], *flags
+        )
+        writes.append(
+            (libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_CONTENT, word)
+        )
+    return writes
+
+
+def device_calls(libcaer):
+    """The recorded calls, writes as (mod_addr, param_addr, param) tuples.
+
+    `caerDynapseSendDataToUSB` sends each word as a CHIP_CONTENT write,
+    the other calls are given by their names.
+    """
+    device_calls = []
+    for name, args, _ in libcaer.calls:
+        if name == "caerDeviceConfigSet":
+            device_calls.append(tuple(args[1:]))
+        elif name == "caerDynapseSendDataToUSB":
+            device_calls.extend(
+                (libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_CONTENT, word)
+                for word in args[1][: args[2]]
+            )
+        else:
+            device_calls.append(name)
+    return device_calls
+
+
+@pytest.mark.parametrize("core_ids", [(0, 1, 2, 3), [2], [0, 3], []])
+def test_set_activity_bias_matches_baseline(libcaer, dynapse, bias_obj, core_ids):
+    dynapse.set_activity_bias(bias_obj, 2, core_ids=core_ids)
+
+    assert device_calls(libcaer) == baseline_activity_bias_writes(
+        libcaer, bias_obj, 2, core_ids
+    )
+
+
+@pytest.fixture
+def bias_words_encoded(libcaer, monkeypatch):
+    """Count the `set_dynapse_bias_multi` calls, with an empty word cache."""
+    encoded = []
+    set_dynapse_bias_multi = libcaer.set_dynapse_bias_multi
+
+    def count_encoding(bias_vec, num_biases):
+        encoded.append(num_biases)
+        return set_dynapse_bias_multi(bias_vec, num_biases)
+
+    monkeypatch.setattr(libcaer, "set_dynapse_bias_multi", count_encoding)
+    dynapse_module._encode_bias_rows.cache_clear()
+    yield encoded
+    dynapse_module._encode_bias_rows.cache_clear()
+
+
+@pytest.mark.parametrize("scope", ["all", {0: [0, 1], 2: [3], 3: []}])
+def test_set_bias_matches_baseline(
+    libcaer, dynapse, bias_obj, bias_words_encoded, scope
+):
+    dynapse.STREAM_STOP_DELAY = dynapse.BIAS_SETTLE_DELAY = 0
+    dynapse.set_bias(bias_obj, fpga_bias=False, scope=scope)
+
+    if scope == "all":
+        scope = dict.fromkeys(range(4), [0, 1, 2, 3])
+    chip = libcaer.DYNAPSE_CONFIG_CHIP
+    aer = libcaer.DYNAPSE_CONFIG_AER
+    expected = [
+        "caerDeviceDataStop",
+        (chip, libcaer.DYNAPSE_CONFIG_CHIP_RUN, True),
+        (aer, libcaer.DYNAPSE_CONFIG_AER_RUN, True),
+    ]
+    for chip_id, core_ids in scope.items():
+        expected += baseline_activity_bias_writes(libcaer, bias_obj, chip_id, core_ids)
+    expected += [
+        (chip, libcaer.DYNAPSE_CONFIG_CHIP_RUN, False),
+        (aer, libcaer.DYNAPSE_CONFIG_AER_RUN, False),
+        "caerDeviceDataStart",
+        (
+            libcaer.CAER_HOST_CONFIG_DATAEXCHANGE,
+            libcaer.CAER_HOST_CONFIG_DATAEXCHANGE_BLOCKING,
+            True,
+        ),
+    ]
+    assert device_calls(libcaer) == expected
+
+    # the words are encoded once for all the chips
+    assert len(bias_words_encoded) == 1
+
+
+@pytest.fixture
+def bias_values_read(dynapse, monkeypatch):
+    """Record the core ids of each `_get_bias_values` call."""
+    read = []
+    get_bias_values = dynapse._get_bias_values
+
+    def record_read(bias_obj, core_ids):
+        read.append(list(core_ids))
+        return get_bias_values(bias_obj, core_ids)
+
+    monkeypatch.setattr(dynapse, "_get_bias_values", record_read)
+    return read
+
+
+def test_set_bias_reads_the_values_once(dynapse, bias_obj, bias_values_read):
+    dynapse.STREAM_STOP_DELAY = dynapse.BIAS_SETTLE_DELAY = 0
+    dynapse.set_bias(bias_obj, scope={1: [2, 0], 3: [0]})
+
+    assert bias_values_read == [[0, 2]]
+
+
+def test_set_chip_bias_matches_baseline(libcaer, dynapse, bias_obj, bias_values_read):
+    dynapse.STREAM_STOP_DELAY = dynapse.BIAS_SETTLE_DELAY = 0
+    dynapse.set_chip_bias(bias_obj, 1, core_ids=[3, 0, 3])
+
+    assert bias_values_read == [[0, 3]]
+    # the cores are written in the given order
+    writes = baseline_activity_bias_writes(libcaer, bias_obj, 1, [3, 0, 3])
+    calls = device_calls(libcaer)
+    start = calls.index(writes[0])
+    assert calls[start : start + len(writes)] == writes
+
+
+def test_write_cam_batch_matches_write_cam(libcaer, dynapse):
+    cams = [(1, 2, 3, 0), (1023, 1023, 63, 3), (0, 512, 0, 1)]
+    for cam in cams:
+        dynapse.write_cam(*cam)
+    expected = libcaer.calls[:]
+    del libcaer.calls[:]
+
+    assert dynapse.write_cam_batch(*np.array(cams).T) is True
+    assert libcaer.calls == expected
+
+    # a single value is used for all the CAMs
+    del libcaer.calls[:]
+    dynapse.write_cam_batch([1, 1023, 0], [2, 1023, 512], [3, 63, 0], 2)
+    assert [call[1][-1] for call in libcaer.calls] == [2, 2, 2]
+
+
+@pytest.mark.parametrize(
+    "cam",
+    [(-1, 0, 0, 0), (1024, 0, 0, 0), (0, 1024, 0, 0), (0, 0, 64, 0), (0, 0, 0, 4)],
+)
+def test_write_cam_batch_rejects_out_of_range(libcaer, dynapse, cam):
+    with pytest.raises(ValueError):
+        dynapse.write_cam_batch(*np.array([cam, (0, 0, 0, 0)]).T)
+    assert libcaer.calls == []
+
+
+@pytest.fixture
+def bias_file_loads(dynapse, monkeypatch):
+    """Record the parsed bias files, and the biases passed to `set_bias`.
+
+    # Returns
+        bias_file_loads: `dict`<br/>
+            `parsed` paths and `set_bias` dictionaries.
+    """
+    bias_file_loads = {"parsed": [], "set_bias": []}
+    load_dynapse_bias = utils.load_dynapse_bias
+
+    def record_load(file_path, verbose=False):
+        bias_file_loads["parsed"].append(file_path)
+        return load_dynapse_bias(file_path, verbose)
+
+    monkeypatch.setattr(utils, "load_dynapse_bias", record_load)
+    monkeypatch.setattr(
+        dynapse,
+        "set_bias",
+        lambda bias_obj, **kwargs: bias_file_loads["set_bias"].append(bias_obj),
+    )
+    dynapse_module._load_bias_cached.cache_clear()
+    yield bias_file_loads
+    dynapse_module._load_bias_cached.cache_clear()
+
+
+def test_set_bias_from_json_caches_parsed_file(
+    dynapse, bias_file_loads, tmp_path, monkeypatch
+):
+    file_path = str(tmp_path / "bias.json")
+    utils.write_json(file_path, {"d_ssp_fine": 1})
+
+    dynapse.set_bias_from_json(file_path)
+    # the caller can change its copy
+    bias_file_loads["set_bias"][0]["d_ssp_fine"] = 2
+    monkeypatch.chdir(tmp_path)
+    dynapse.set_bias_from_json("bias.json")
+
+    assert bias_file_loads["parsed"] == [file_path]
+    assert bias_file_loads["set_bias"][1] == {"d_ssp_fine": 1}
+
+
+def test_set_bias_from_json_parses_edited_file(dynapse, bias_file_loads, tmp_path):
+    file_path = str(tmp_path / "bias.json")
+    utils.write_json(file_path, {"d_ssp_fine": 1})
+    os.utime(file_path, (0, 0))
+    dynapse.set_bias_from_json(file_path)
+
+    utils.write_json(file_path, {"d_ssp_fine": 2})
+    dynapse.set_bias_from_json(file_path)
+    # verbose loads are not cached
+    dynapse.set_bias_from_json(file_path, verbose=True)
+
+    assert bias_file_loads["parsed"] == [file_path] * 3
+    values = [bias_obj["d_ssp_fine"] for bias_obj in bias_file_loads["set_bias"]]
+    assert values == [1, 2, 2]
+
+
+def test_set_bias_without_blocking_defers_the_restart(libcaer, dynapse, bias_obj):
+    dynapse.STREAM_STOP_DELAY = dynapse.BIAS_SETTLE_DELAY = 0
+    dynapse.set_bias(bias_obj)
+    blocking_calls = device_calls(libcaer)
+    del libcaer.calls[:]
+
+    dynapse.set_bias(bias_obj, block=False)
+    assert dynapse._stable_at is not None
+    # the same writes, the stream is restarted by the next device access
+    restart = blocking_calls[-2:]
+    assert device_calls(libcaer) == blocking_calls[:-2]
+
+    del libcaer.calls[:]
+    dynapse.write_cam(1, 2, 3, 0)
+    assert device_calls(libcaer) == restart + ["caerDynapseWriteCam"]
+    assert dynapse._stable_at is None
+
+    # only once
+    del libcaer.calls[:]
+    dynapse.write_cam(1, 2, 3, 0)
+    assert device_calls(libcaer) == ["caerDynapseWriteCam"]
+
+
+def test_data_stop_drops_pending_restart(libcaer, dynapse, bias_obj, monkeypatch):
+    monkeypatch.setattr(libcaer, "caerDeviceDataGet", lambda handle: None)
+    dynapse.STREAM_STOP_DELAY = dynapse.BIAS_SETTLE_DELAY = 0
+    for stop in [dynapse.data_stop, dynapse.shutdown]:
+        dynapse.set_bias(bias_obj, block=False)
+        stop()
+        del libcaer.calls[:]
+
+        for access in [
+            dynapse.wait_stable,
+            dynapse.get_event,
+            dynapse.clear_sram,
+            lambda: dynapse.write_cam(1, 2, 3, 0),
+        ]:
+            access()
+        assert "caerDeviceDataStart" not in device_calls(libcaer)
+
+
+def test_write_sram_N_batch_matches_write_sram_N(libcaer, dynapse):
+    srams = [
+        (1, 0, 0, False, 0, False, 0, 1),
+        (1023, 3, 3, True, 3, True, 3, 15),
+        (512, 2, 1, False, 1, True, 2, 4),
+    ]
+    for sram in srams:
+        dynapse.write_sram_N(*sram)
+    expected = libcaer.calls[:]
+    del libcaer.calls[:]
+
+    assert dynapse.write_sram_N_batch(*np.array(srams).T) is True
+    assert libcaer.calls == expected
+
+    # a single value is used for all the SRAMs
+    del libcaer.calls[:]
+    dynapse.write_sram_N_batch([1, 2], 3, 0, True, 1, False, 2, 15)
+    assert [call[1][1:] for call in libcaer.calls] == [
+        (1, 3, 0, True, 1, False, 2, 15),
+        (2, 3, 0, True, 1, False, 2, 15),
+    ]
+
+
+@pytest.mark.parametrize("index, value", [(0, 1024), (1, 4), (4, 4), (7, 16), (2, -1)])
+def test_write_sram_N_batch_rejects_out_of_range(libcaer, dynapse, index, value):
+    sram = [1, 0, 0, 0, 0, 0, 0, 1]
+    sram[index] = value
+    with pytest.raises(ValueError):
+        dynapse.write_sram_N_batch(*sram)
+    assert libcaer.calls == []
+
+
+def test_write_poisson_spikerate_batch_matches_scalar(libcaer, dynapse):
+    rates = [(0, 0.0), (1023, 4300.0), (512, 100.5)]
+    for neuron_id, rate in rates:
+        dynapse.write_poisson_spikerate(neuron_id, rate)
+    expected = libcaer.calls[:]
+    del libcaer.calls[:]
+
+    assert dynapse.write_poisson_spikerate_batch(*np.array(rates).T) is True
+    assert libcaer.calls == expected
+
+    # a single rate is used for all the neurons
+    del libcaer.calls[:]
+    dynapse.write_poisson_spikerate_batch([1, 2], 10)
+    assert [call[1][1:] for call in libcaer.calls] == [(1, 10.0), (2, 10.0)]
+
+
+@pytest.mark.parametrize(
+    "neuron_ids, rates", [([-1], [10]), ([1024], [10]), ([1], [-1]), ([1], [4301])]
+)
+def test_write_poisson_spikerate_batch_rejects_out_of_range(
+    libcaer, dynapse, neuron_ids, rates
+):
+    with pytest.raises(ValueError):
+        dynapse.write_poisson_spikerate_batch(neuron_ids, rates)
+    assert libcaer.calls == []
+
+
+def test_set_bias_sends_one_transfer_per_chip(libcaer, dynapse, bias_obj):
+    dynapse.STREAM_STOP_DELAY = dynapse.BIAS_SETTLE_DELAY = 0
+    dynapse.set_bias(bias_obj, fpga_bias=False, scope={0: [0, 1, 2, 3], 2: [1]})
+
+    # the selected chips, and the number of words of each transfer
+    transfers = []
+    for name, args, _ in libcaer.calls:
+        if name == "caerDynapseSendDataToUSB":
+            transfers.append(("words", args[2]))
+        elif args[1:3] == (libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_ID):
+            transfers.append(("chip", args[3]))
+
+    num_core_biases = len(BASELINE_CORE_BIASES)
+    num_global_biases = len(BASELINE_GLOBAL_BIASES)
+    assert transfers == [
+        ("chip", 0),
+        ("words", 4 * num_core_biases + num_global_biases),
+        ("chip", 2),
+        ("words", num_core_biases + num_global_biases),
+    ]
+
+
+def test_chip_content_is_not_written_without_handle(libcaer, dynapse, bias_obj):
+    dynapse.handle = None
+    dynapse.set_activity_bias(bias_obj, 0)
+
+    assert libcaer.calls == []
+
+
+def test_set_bias_live_keeps_the_stream_running(libcaer, dynapse, bias_obj):
+    dynapse.STREAM_STOP_DELAY = dynapse.BIAS_SETTLE_DELAY = 0
+    dynapse.set_bias(bias_obj, scope={1: [0, 2]})
+    stopped_calls = device_calls(libcaer)
+    del libcaer.calls[:]
+
+    assert dynapse.set_bias(bias_obj, scope={1: [0, 2]}, live=True) is True
+    # the same writes without stopping and restarting the chips and stream
+    run_calls = [
+        "caerDeviceDataStop",
+        "caerDeviceDataStart",
+        (libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_RUN, True),
+        (libcaer.DYNAPSE_CONFIG_AER, libcaer.DYNAPSE_CONFIG_AER_RUN, True),
+        (libcaer.DYNAPSE_CONFIG_CHIP, libcaer.DYNAPSE_CONFIG_CHIP_RUN, False),
+        (libcaer.DYNAPSE_CONFIG_AER, libcaer.DYNAPSE_CONFIG_AER_RUN, False),
+        (
+            libcaer.CAER_HOST_CONFIG_DATAEXCHANGE,
+            libcaer.CAER_HOST_CONFIG_DATAEXCHANGE_BLOCKING,
+            True,
+        ),
+    ]
+    live_calls = device_calls(libcaer)
+    assert live_calls == [call for call in stopped_calls if call not in run_calls]
+    assert len(live_calls) == len(stopped_calls) - len(run_calls)
+    assert dynapse._stable_at is None
+
+
+@pytest.mark.parametrize("live", [False, True])
+def test_set_bias_reports_failed_writes(libcaer, dynapse, bias_obj, monkeypatch, live):
+    dynapse.STREAM_STOP_DELAY = dynapse.BIAS_SETTLE_DELAY = 0
+    assert dynapse.set_bias(bias_obj, live=live) is True
+
+    monkeypatch.setattr(
+        libcaer, "caerDynapseSendDataToUSB", lambda handle, words, num_words: False
+    )
+    assert dynapse.set_bias(bias_obj, live=live) is False
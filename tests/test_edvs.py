@@ -0,0 +1,180 @@
+"""Tests for eDVS.
+
+Author: Yuhuang Hu
+Email : duguyue100@gmail.com
+"""
+import numpy as np
+import pytest
+
+from pyaer.edvs import eDVS
+
+
+@pytest.fixture
+def edvs(libcaer, monkeypatch):
+    """eDVS whose containers hold the packets in `edvs.packets`.
+
+    Each packet is a (packet type, number of events) pair, polarity events
+    get a validity column if the noise filter is on. The decoders are
+    replaced in the class, as the device binds them when it is created.
+    """
+
+    def get_polarity_event(self, packet_header, noise_filter=False):
+        num_events = self.packets[packet_header][1]
+        num_fields = 5 if noise_filter else 4
+        events = np.arange(num_events * num_fields).reshape(num_events, num_fields)
+        return events + packet_header * 1000, num_events
+
+    def get_special_event(self, packet_header):
+        num_events = self.packets[packet_header][1]
+        return np.zeros((num_events, 2), dtype=np.int64), num_events
+
+    monkeypatch.setattr(eDVS, "get_polarity_event", get_polarity_event)
+    monkeypatch.setattr(eDVS, "get_special_event", get_special_event)
+    edvs = eDVS()
+    edvs.packets = []
+
+    monkeypatch.setattr(libcaer, "caerDeviceDataGet", lambda handle: object())
+    monkeypatch.setattr(
+        libcaer,
+        "caerEventPacketContainerGetEventPacketsNumber",
+        lambda c: len(edvs.packets),
+    )
+    monkeypatch.setattr(
+        edvs,
+        "get_packet_header",
+        lambda packet_container, idx: (idx, edvs.packets[idx][0]),
+    )
+    return edvs
+
+
+def test_get_event_stacks_packets(libcaer, edvs):
+    edvs.packets = [
+        (libcaer.POLARITY_EVENT, 2),
+        (libcaer.SPECIAL_EVENT, 1),
+        (libcaer.POLARITY_EVENT, 3),
+    ]
+
+    pol_events, num_pol_event, special_events, num_special_event = edvs.get_event()
+
+    assert num_pol_event == 5 and pol_events.shape == (5, 4)
+    assert pol_events[2:, 0].tolist() == [2000, 2004, 2008]
+    assert num_special_event == 1 and special_events.shape == (1, 2)
+
+
+def test_get_event_skips_other_packet_types(libcaer, edvs):
+    edvs.packets = [
+        (libcaer.FRAME_EVENT, 4),
+        (libcaer.POLARITY_EVENT, 1),
+        (libcaer.IMU6_EVENT, 2),
+    ]
+
+    pol_events, num_pol_event, special_events, num_special_event = edvs.get_event()
+
+    assert num_pol_event == 1 and pol_events[:, 0].tolist() == [1000]
+    assert num_special_event == 0 and special_events is None
+
+
+def test_get_event_without_copy_reuses_buffer(libcaer, edvs):
+    edvs.packets = [(libcaer.POLARITY_EVENT, 3)]
+    first = edvs.get_event(copy=False)[0]
+    copied = edvs.get_event()[0]
+
+    assert np.shares_memory(first, edvs._pol_buffer)
+    assert not np.shares_memory(copied, edvs._pol_buffer)
+
+    # growing at least doubles the capacity
+    edvs.packets = [(libcaer.POLARITY_EVENT, 2), (libcaer.POLARITY_EVENT, 2)]
+    second = edvs.get_event(copy=False)[0]
+    assert edvs._pol_buffer.shape == (6, 4)
+    buffer = edvs._pol_buffer
+
+    edvs.packets = [(libcaer.SPECIAL_EVENT, 1), (libcaer.POLARITY_EVENT, 5)]
+    third = edvs.get_event(copy=False)[0]
+
+    assert edvs._pol_buffer is buffer
+    assert np.shares_memory(second, third)
+    assert third[:, 0].tolist() == [1000, 1004, 1008, 1012, 1016]
+
+
+def test_get_event_noise_filter_adds_validity_column(libcaer, edvs):
+    edvs.packets = [(libcaer.POLARITY_EVENT, 3)]
+    assert edvs.get_event(copy=False)[0].shape == (3, 4)
+
+    edvs.enable_noise_filter()
+    assert edvs.get_event(copy=False)[0].shape == (3, 5)
+    assert edvs._pol_buffer.shape[1] == 5
+
+    edvs.disable_noise_filter()
+    assert edvs.get_event()[0].shape == (3, 4)
+
+
+def test_get_event_without_container(libcaer, edvs, monkeypatch):
+    monkeypatch.setattr(libcaer, "caerDeviceDataGet", lambda handle: None)
+
+    assert edvs.get_event() is None
+
+
+@pytest.fixture
+def config_values(libcaer, monkeypatch):
+    """Fake `caerDeviceConfigGet` that reads `10 * param_addr + 1`.
+
+    # Returns
+        config_values: `dict`<br/>
+            `requests` records the (mod_addr, param_addr) pair of each read,
+            the pairs in `failing` are not read.
+    """
+    config_values = {"requests": [], "failing": set()}
+
+    def config_get(handle, mod_addr, param_addr):
+        config_values["requests"].append((mod_addr, param_addr))
+        if (mod_addr, param_addr) in config_values["failing"]:
+            return None
+        return 10 * param_addr + 1
+
+    monkeypatch.setattr(libcaer, "caerDeviceConfigGet", config_get)
+    return config_values
+
+
+def test_get_bias_matches_get_config(edvs, config_values):
+    expected = {
+        bias_name: edvs.get_config(module_address, parameter_address)
+        for bias_name, module_address, parameter_address in edvs.configs_list
+    }
+    per_call_requests = config_values["requests"][:]
+    del config_values["requests"][:]
+
+    assert edvs.get_bias() == expected
+    assert config_values["requests"] == per_call_requests
+
+    # a failed read is None, the other biases are still read
+    _, module_address, parameter_address = edvs.configs_list[3]
+    config_values["failing"].add((module_address, parameter_address))
+    bias_obj = edvs.get_bias()
+    assert bias_obj.pop(edvs.configs_list[3][0]) is None
+    assert all(value is not None for value in bias_obj.values())
+
+    edvs.handle = None
+    assert edvs.get_bias() == dict.fromkeys(expected)
+
+
+def test_set_bias_matches_set_config(libcaer, edvs, monkeypatch):
+    bias_obj = {
+        bias_name: index * 7
+        for index, (bias_name, _, _) in enumerate(edvs.configs_list)
+    }
+    del libcaer.calls[:]
+    for bias_name, module_address, parameter_address in edvs.configs_list:
+        edvs.set_config(module_address, parameter_address, bias_obj[bias_name])
+    expected = libcaer.calls[:]
+    del libcaer.calls[:]
+
+    assert edvs.set_bias(bias_obj) is True
+    assert libcaer.calls == expected
+
+    # a failed write is reported, the other biases are still written
+    monkeypatch.setattr(
+        libcaer,
+        "caerDeviceConfigSet",
+        lambda handle, mod_addr, param_addr, param: param != 21,
+    )
+    assert edvs.set_bias(bias_obj) is False
@@ -0,0 +1,34 @@
+"""Tests for the utilities.
+
+Author: Yuhuang Hu
+Email : duguyue100@gmail.com
+"""
+import json
+
+import pytest
+
+from pyaer import utils
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_parser(request, monkeypatch):
+    """Run a test with and without orjson."""
+    if request.param == "json":
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_write_json_keeps_json_format(json_parser, tmp_path):
+    bias_obj = {"cas": 1, "injGnd": 2}
+    file_path = str(tmp_path / "bias.json")
+
+    assert utils.write_json(file_path, bias_obj) is True
+    with open(file_path) as f:
+        assert f.read() == json.dumps(bias_obj)
+    assert utils.load_json(file_path) == bias_obj
+
+
+def test_load_json_missing_file(json_parser, tmp_path):
+    assert utils.load_json(str(tmp_path / "missing.json")) is None